@@ -8,7 +8,28 @@ __version__ = "0.1.3"
 __author__ = "Pavel Ravvich"
 __license__ = "MIT"
 
-from firesync.config import FiresyncConfig
-from firesync.gcloud import GCloudClient
-
 __all__ = ["FiresyncConfig", "GCloudClient", "__version__"]
+
+# Public names loaded on first access (PEP 562), so that importing
+# firesync.main for --version or --help does not import config and gcloud
+_LAZY_ATTRS = {
+    "FiresyncConfig": "firesync.config",
+    "GCloudClient": "firesync.gcloud",
+}
+
+
+def __getattr__(name):
+    """Import public classes on first attribute access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily loaded names alongside regular module attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,88 @@
+"""In-process caching of parsed files for FireSync."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple, Union
+
+FileSignature = Tuple[int, int, int]
+
+
+def file_signature(path: Union[str, Path]) -> FileSignature:
+    """
+    Get a signature that changes whenever a file is modified.
+
+    In-place edits bump mtime_ns or size, atomic replacements
+    (write to temp file + os.replace) produce a new inode.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Tuple of (st_mtime_ns, st_size, st_ino)
+
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class FileCache:
+    """
+    Thread-safe cache of parsed file contents keyed by path and file signature.
+
+    A file rewritten in place with the same size, within the filesystem's
+    mtime granularity, keeps its signature, and the stale parsed contents are
+    returned. Code that writes a cached file itself must call invalidate().
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[str, Tuple[FileSignature, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Union[str, Path], parse: Callable[[Path], Any]) -> Any:
+        """
+        Get parsed file contents, parsing the file only if it changed.
+
+        The cached object is returned as is, callers that hand it out
+        to code which may mutate it must copy it first.
+
+        Args:
+            path: Path to the file
+            parse: Function that reads and parses the file
+
+        Returns:
+            Result of parse() for the current file contents
+
+        Raises:
+            OSError: If the file cannot be stat'ed
+        """
+        key = os.fspath(path)
+        signature = file_signature(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+
+        value = parse(Path(key))
+        with self._lock:
+            self._entries[key] = (signature, value)
+        return value
+
+    def invalidate(self, path: Union[str, Path]) -> None:
+        """
+        Drop the cached entry for a file.
+
+        Args:
+            path: Path to the file
+        """
+        with self._lock:
+            self._entries.pop(os.fspath(path), None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
@@ -1,13 +1,30 @@
 """Common CLI utilities for FireSync commands."""
 
 import argparse
-from typing import Optional, Tuple
+import os
+from functools import lru_cache
+from typing import List, Optional, TextIO, Tuple
 
 from firesync.config import FiresyncConfig
 from firesync.gcloud import GCloudClient
 from firesync.workspace import load_config
 
 
+_INCOMPLETE_MIGRATION = "Both --env-from and --env-to must be specified for migration mode"
+
+# Validation error by bitmask of (env_from, env_to, env), None if valid
+_MIGRATION_ARG_ERRORS = {
+    0b000: "Must specify either (--env-from and --env-to) or --env",
+    0b001: None,
+    0b010: _INCOMPLETE_MIGRATION,
+    0b011: _INCOMPLETE_MIGRATION,
+    0b100: _INCOMPLETE_MIGRATION,
+    0b101: _INCOMPLETE_MIGRATION,
+    0b110: None,
+    0b111: "Cannot use --env-from/--env-to with --env",
+}
+
+
 def _validate_migration_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
     """
     Validate migration mode arguments.
@@ -19,20 +36,122 @@ def _validate_migration_args(parser: argparse.ArgumentParser, args: argparse.Nam
     Raises:
         SystemExit: If validation fails
     """
-    migration_mode = args.env_from and args.env_to
-    standard_mode = args.env
+    mask = (bool(args.env_from) << 2) | (bool(args.env_to) << 1) | bool(args.env)
+    error = _MIGRATION_ARG_ERRORS[mask]
+    if error:
+        parser.error(error)
+
+
+def _add_migration_args(parser: argparse.ArgumentParser, purpose: str) -> None:
+    """
+    Add migration and standard mode arguments shared by plan and apply.
+
+    Args:
+        parser: Argument parser to extend
+        purpose: Migration purpose shown in help (e.g. "migration planning")
+    """
+    # Environment migration mode
+    parser.add_argument(
+        "--env-from",
+        help=f"Source environment name (for {purpose})"
+    )
+    parser.add_argument(
+        "--env-to",
+        help=f"Target environment name (for {purpose})"
+    )
+
+    # Standard mode - single environment
+    parser.add_argument(
+        "--env",
+        help="Environment name from workspace config"
+    )
+
+    # Schema directory override
+    parser.add_argument(
+        "--schema-dir",
+        help="Directory with schema JSON files (overrides workspace config)"
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_parser(kind: str, description: str) -> argparse.ArgumentParser:
+    """
+    Build argument parser for a command, reused across calls.
+
+    Args:
+        kind: Command name ("pull", "plan" or "apply")
+        description: Command description
+
+    Returns:
+        Configured argument parser
+
+    Raises:
+        ValueError: If kind is unknown
+    """
+    parser = argparse.ArgumentParser(description=description)
 
-    if migration_mode and standard_mode:
-        parser.error("Cannot use --env-from/--env-to with --env")
+    if kind == "pull":
+        # Authentication options (mutually exclusive groups)
+        auth_group = parser.add_mutually_exclusive_group(required=True)
+
+        # Pull all environments
+        auth_group.add_argument(
+            "--all",
+            action="store_true",
+            help="Pull all environments from workspace config"
+        )
+
+        # Single environment
+        auth_group.add_argument(
+            "--env",
+            help="Environment name from workspace config"
+        )
+
+        # Concurrency of --all
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            default=min(4, os.cpu_count() or 1),
+            help="Maximum number of environments to pull in parallel with --all (default: min(4, CPU count))"
+        )
+
+    elif kind == "plan":
+        _add_migration_args(parser, "migration planning")
+
+        # Output verbosity
+        parser.add_argument(
+            "--quiet",
+            action="store_true",
+            help="Print only the number of changes per resource type"
+        )
+
+    elif kind == "apply":
+        _add_migration_args(parser, "migration")
+
+        # Concurrency of gcloud commands
+        parser.add_argument(
+            "--max-parallel",
+            type=int,
+            default=1,
+            help="Maximum number of gcloud commands to run in parallel (default: 1)"
+        )
+        parser.add_argument(
+            "--async",
+            dest="no_wait",
+            action="store_true",
+            help=(
+                "Start index and TTL operations without waiting for them to complete "
+                "(fields with multiple single-field indexes are skipped)"
+            )
+        )
 
-    if not migration_mode and not standard_mode:
-        parser.error("Must specify either (--env-from and --env-to) or --env")
+    else:
+        raise ValueError(f"Unknown command: {kind}")
 
-    if (args.env_from and not args.env_to) or (args.env_to and not args.env_from):
-        parser.error("Both --env-from and --env-to must be specified for migration mode")
+    return parser
 
 
-def parse_pull_args(description: str) -> argparse.Namespace:
+def parse_pull_args(description: str, argv: Optional[List[str]] = None) -> argparse.Namespace:
     """
     Parse command-line arguments for pull command.
 
@@ -42,32 +161,19 @@ def parse_pull_args(description: str) -> argparse.Namespace:
 
     Args:
         description: Command description
+        argv: Arguments to parse (default: sys.argv[1:])
 
     Returns:
         Parsed arguments namespace
     """
-    parser = argparse.ArgumentParser(description=description)
-
-    # Authentication options (mutually exclusive groups)
-    auth_group = parser.add_mutually_exclusive_group(required=True)
-
-    # Pull all environments
-    auth_group.add_argument(
-        "--all",
-        action="store_true",
-        help="Pull all environments from workspace config"
-    )
-
-    # Single environment
-    auth_group.add_argument(
-        "--env",
-        help="Environment name from workspace config"
-    )
-
-    return parser.parse_args()
+    parser = _build_parser("pull", description)
+    args = parser.parse_args(argv)
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    return args
 
 
-def parse_plan_args(description: str) -> argparse.Namespace:
+def parse_plan_args(description: str, argv: Optional[List[str]] = None) -> argparse.Namespace:
     """
     Parse command-line arguments for plan command.
 
@@ -77,40 +183,18 @@ def parse_plan_args(description: str) -> argparse.Namespace:
 
     Args:
         description: Command description
+        argv: Arguments to parse (default: sys.argv[1:])
 
     Returns:
         Parsed arguments namespace
     """
-    parser = argparse.ArgumentParser(description=description)
-
-    # Environment migration mode
-    parser.add_argument(
-        "--env-from",
-        help="Source environment name (for migration planning)"
-    )
-    parser.add_argument(
-        "--env-to",
-        help="Target environment name (for migration planning)"
-    )
-
-    # Standard mode - single environment
-    parser.add_argument(
-        "--env",
-        help="Environment name from workspace config"
-    )
-
-    # Schema directory override
-    parser.add_argument(
-        "--schema-dir",
-        help="Directory with schema JSON files (overrides workspace config)"
-    )
-
-    args = parser.parse_args()
+    parser = _build_parser("plan", description)
+    args = parser.parse_args(argv)
     _validate_migration_args(parser, args)
     return args
 
 
-def parse_apply_args(description: str) -> argparse.Namespace:
+def parse_apply_args(description: str, argv: Optional[List[str]] = None) -> argparse.Namespace:
     """
     Parse command-line arguments for apply command.
 
@@ -120,42 +204,23 @@ def parse_apply_args(description: str) -> argparse.Namespace:
 
     Args:
         description: Command description
+        argv: Arguments to parse (default: sys.argv[1:])
 
     Returns:
         Parsed arguments namespace
     """
-    parser = argparse.ArgumentParser(description=description)
-
-    # Environment migration mode
-    parser.add_argument(
-        "--env-from",
-        help="Source environment name (for migration)"
-    )
-    parser.add_argument(
-        "--env-to",
-        help="Target environment name (for migration)"
-    )
-
-    # Standard mode - single environment
-    parser.add_argument(
-        "--env",
-        help="Environment name from workspace config"
-    )
-
-    # Schema directory override
-    parser.add_argument(
-        "--schema-dir",
-        help="Directory with schema JSON files (overrides workspace config)"
-    )
-
-    args = parser.parse_args()
+    parser = _build_parser("apply", description)
+    args = parser.parse_args(argv)
     _validate_migration_args(parser, args)
+    if args.max_parallel < 1:
+        parser.error("--max-parallel must be at least 1")
     return args
 
 
 def setup_client(
     env: str,
-    schema_dir: Optional[str] = None
+    schema_dir: Optional[str] = None,
+    output: Optional[TextIO] = None
 ) -> Tuple[FiresyncConfig, GCloudClient]:
     """
     Set up configuration and GCloud client from workspace environment.
@@ -163,6 +228,7 @@ def setup_client(
     Args:
         env: Environment name from workspace config
         schema_dir: Schema directory path (optional override)
+        output: Stream for progress messages (default: sys.stdout)
 
     Returns:
         Tuple of (config, client)
@@ -197,9 +263,10 @@ def setup_client(
     config = FiresyncConfig.from_args(
         key_path=actual_key_path,
         key_env=actual_key_env,
-        schema_dir=actual_schema_dir
+        schema_dir=actual_schema_dir,
+        output=output
     )
 
-    config.display_info()
-    client = GCloudClient(config)
+    config.display_info(output)
+    client = GCloudClient(config, output)
     return config, client
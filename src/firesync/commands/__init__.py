@@ -1,9 +1,30 @@
 """FireSync CLI commands."""
 
-from firesync.commands.init import main as init_main
-from firesync.commands.pull import main as pull_main
-from firesync.commands.plan import main as plan_main
-from firesync.commands.apply import main as apply_main
-from firesync.commands.env import main as env_main
-
 __all__ = ["init_main", "pull_main", "plan_main", "apply_main", "env_main"]
+
+# Command entry points loaded on first access (PEP 562), so that importing
+# one command module does not import every other command with it
+_LAZY_ATTRS = {
+    "init_main": "firesync.commands.init",
+    "pull_main": "firesync.commands.pull",
+    "plan_main": "firesync.commands.plan",
+    "apply_main": "firesync.commands.apply",
+    "env_main": "firesync.commands.env",
+}
+
+
+def __getattr__(name):
+    """Import command entry points on first attribute access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = import_module(module_name).main
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily loaded names alongside regular module attributes."""
+    return sorted(set(globals()) | set(__all__))
@@ -3,7 +3,9 @@
 
 import logging
 import sys
-from typing import Callable, List, Dict, Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, List, Dict, Any, Optional, Tuple
 
 from firesync.cli import parse_apply_args, setup_client
 from firesync.gcloud import GCloudClient
@@ -17,22 +19,78 @@ from firesync.operations import (
     FieldIndexOperations,
     TTLPolicyOperations,
 )
-from firesync.schema import SchemaFile, load_schema_file
+from firesync.schema import (
+    SchemaFile,
+    load_schema_file,
+    validate_composite_index,
+    validate_ttl_policy,
+)
 from firesync.workspace import load_config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s: %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Default number of gcloud commands run concurrently, concurrent gcloud
+# processes share local state so commands run one at a time unless asked
+DEFAULT_MAX_PARALLEL = 1
+
+
+def run_commands(
+    client: GCloudClient,
+    commands: List[List[str]],
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    no_wait: bool = False,
+    keys: Optional[List[Hashable]] = None
+) -> int:
+    """
+    Run gcloud commands with error tolerance, optionally in parallel.
+
+    With max_parallel above 1, commands are overlapped in a thread pool.
+    Commands sharing a key (e.g. updates of the same field) always run one
+    after another in input order, so they never race each other.
+
+    Args:
+        client: GCloud client
+        commands: Command argument lists (without 'gcloud' prefix)
+        max_parallel: Maximum number of commands running at once
+        no_wait: If True, pass --async so gcloud returns once the
+            long-running operation is started instead of polling it
+        keys: Optional key per command, commands with equal keys run serially
+
+    Returns:
+        Number of successful commands
+    """
+    if not commands:
+        return 0
+
+    if no_wait:
+        commands = [cmd + ["--async"] for cmd in commands]
+
+    if max_parallel <= 1:
+        return sum(1 for cmd in commands if client.run_command_tolerant(cmd))
+
+    if keys is None:
+        batches = [[cmd] for cmd in commands]
+    else:
+        grouped: Dict[Hashable, List[List[str]]] = {}
+        for key, cmd in zip(keys, commands):
+            grouped.setdefault(key, []).append(cmd)
+        batches = list(grouped.values())
+
+    def run_batch(batch: List[List[str]]) -> int:
+        return sum(1 for cmd in batch if client.run_command_tolerant(cmd, defer_output=True))
+
+    with ThreadPoolExecutor(max_workers=min(max_parallel, len(batches))) as executor:
+        return sum(executor.map(run_batch, batches))
+
 
 def apply_resources(
     client: GCloudClient,
     resources: List[Dict[str, Any]],
     build_command: Callable[[Dict[str, Any]], List[str]],
-    resource_type: str
+    resource_type: str,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    no_wait: bool = False,
+    validate: Optional[Callable[[Dict[str, Any]], bool]] = None
 ) -> int:
     """
     Apply resources to Firestore with error handling.
@@ -42,30 +100,96 @@ def apply_resources(
         resources: List of resource definitions
         build_command: Function to build gcloud command from resource
         resource_type: Resource type name for logging
+        max_parallel: Maximum number of gcloud commands running at once
+        no_wait: If True, don't wait for operations to complete
+        validate: Optional function rejecting malformed resources up front,
+            it reports each rejected resource
 
     Returns:
         Number of successfully applied resources
     """
-    success_count = 0
+    errors = []
+    commands = []
     for resource in resources:
         try:
-            cmd = build_command(resource)
-            if client.run_command_tolerant(cmd):
-                success_count += 1
-        except (ValueError, Exception) as e:
-            print(f"[!] Skipping invalid {resource_type}: {e}")
-            logger.warning(f"Invalid {resource_type}: {e}")
-    return success_count
+            # Rejected resources are reported by the validator itself
+            if validate is not None and not validate(resource):
+                continue
+            commands.append(build_command(resource))
+        except Exception as e:
+            errors.append(f"[!] Skipping invalid {resource_type}: {e}")
+    if errors:
+        print("\n".join(errors))
+    return run_commands(client, commands, max_parallel, no_wait)
+
+
+def field_index_specs(entries: List[Dict[str, Any]]) -> List[Tuple[str, str, str]]:
+    """
+    Extract single-field indexes to create from field index entries.
+
+    Handles both normalized entries (collectionGroupId/fieldPath/indexes) and
+    raw GCP format from `firesync pull` (name path, nested indexConfig and
+    fields). System default entries are skipped, invalid entries are
+    reported and skipped.
 
+    Args:
+        entries: Field index entries from field-indexes.json
+
+    Returns:
+        List of (collection, field_path, index_value) tuples
+    """
+    specs = []
+
+    for entry in entries:
+        # Use normalizers to handle both direct fields and GCP resource name paths
+        collection = normalize_collection_name(entry)
+        field_path = normalize_field_path(entry)
+
+        if not collection or not field_path:
+            print(f"[!] Skipping invalid field index entry: {entry}")
+            continue
+
+        # Skip system default entries (wildcard field on __default__ collection)
+        if collection == "__default__" or field_path == "*":
+            logger.debug(f"Skipping system default field index: {collection}/{field_path}")
+            continue
 
-def apply_schema_from_directory(client: GCloudClient, schema_dir):
+        # Get indexes from either direct field or nested indexConfig
+        idx_configs = entry.get("indexes") or entry.get("indexConfig", {}).get("indexes", [])
+
+        for cfg in idx_configs:
+            # Flat: {"order": "ASCENDING"} or {"arrayConfig": "CONTAINS"}
+            # Nested (raw GCP): {"fields": [{"fieldPath": "*", "order": "ASCENDING"}]}
+            if "fields" in cfg:
+                fields_list = cfg["fields"]
+                value = normalize_index_value(fields_list[0]) if fields_list else None
+            else:
+                value = normalize_index_value(cfg)
+
+            if value:
+                specs.append((collection, field_path, value))
+
+    return specs
+
+
+def apply_schema_from_directory(
+    client: GCloudClient,
+    schema_dir,
+    max_parallel: int = DEFAULT_MAX_PARALLEL,
+    no_wait: bool = False
+):
     """
     Apply all schemas from a directory to Firestore.
 
     Args:
         client: GCloud client configured for target environment
         schema_dir: Path to schema directory
+        max_parallel: Maximum number of gcloud commands running at once
+        no_wait: If True, don't wait for operations to complete
     """
+    # With --async the operations are only started, not applied yet
+    verb = "Started" if no_wait else "Processed"
+
     # Apply Composite Indexes
     print("\n[~] Applying Composite Indexes")
     try:
@@ -78,9 +202,12 @@ def apply_schema_from_directory(client: GCloudClient, schema_dir):
             client,
             local_composite,
             CompositeIndexOperations.build_create_command,
-            "composite index"
+            "composite index",
+            max_parallel,
+            no_wait,
+            validate_composite_index
         )
-        print(f"[~] Processed {success_count}/{len(local_composite)} composite indexes")
+        print(f"[~] {verb} {success_count}/{len(local_composite)} composite indexes")
 
     except FileNotFoundError:
         print("[!] Local composite-indexes.json not found, skipping")
@@ -96,55 +223,27 @@ def apply_schema_from_directory(client: GCloudClient, schema_dir):
         if not isinstance(local_fields, list):
             raise ValueError("Expected a list in field-indexes.json")
 
-        success_count = 0
-        total_count = 0
-
-        for entry in local_fields:
-            # Use normalizers to handle both direct fields and GCP resource name paths
-            collection = normalize_collection_name(entry)
-            field_path = normalize_field_path(entry)
-
-            # Get indexes from either direct field or nested indexConfig
-            idx_configs = entry.get("indexes") or entry.get("indexConfig", {}).get("indexes", [])
-
-            if not collection or not field_path:
-                print(f"[!] Skipping invalid field index entry: {entry}")
-                continue
-
-            # Skip system default entries (wildcard field on __default__ collection)
-            if collection == "__default__" or field_path == "*":
-                logger.debug(f"Skipping system default field index: {collection}/{field_path}")
-                continue
-
-            for cfg in idx_configs:
-                # Handle both flat config and nested fields structure
-                # Flat: {"order": "ASCENDING"} or {"arrayConfig": "CONTAINS"}
-                # Nested: {"fields": [{"fieldPath": "*", "order": "ASCENDING"}]}
-                if "fields" in cfg:
-                    # Nested structure from raw GCP format - extract value from first field
-                    fields_list = cfg.get("fields", [])
-                    if fields_list:
-                        value = normalize_index_value(fields_list[0])
-                    else:
-                        value = None
-                else:
-                    value = normalize_index_value(cfg)
-
-                if not value:
-                    continue
-
-                total_count += 1
-                try:
-                    cmd = FieldIndexOperations.build_create_command(
-                        collection, field_path, value
-                    )
-                    if client.run_command_tolerant(cmd):
-                        success_count += 1
-                except Exception as e:
-                    print(f"[!] Failed to create field index: {e}")
-                    logger.warning(f"Failed to create field index: {e}")
-
-        print(f"[~] Processed {success_count}/{total_count} field indexes")
+        specs = field_index_specs(local_fields)
+        total_count = len(specs)
+
+        if no_wait:
+            # Each update of a field starts a long-running operation, a
+            # second update would start before the first one finished
+            value_counts = Counter((collection, field_path) for collection, field_path, _ in specs)
+            multi_index_fields = [key for key, count in value_counts.items() if count > 1]
+            if multi_index_fields:
+                names = ", ".join(f"{collection}.{field_path}" for collection, field_path in multi_index_fields)
+                print(f"[!] Skipping fields with multiple indexes in --async mode, apply them without --async: {names}")
+                specs = [spec for spec in specs if value_counts[spec[:2]] == 1]
+        commands = [
+            FieldIndexOperations.build_create_command(collection, field_path, value)
+            for collection, field_path, value in specs
+        ]
+
+        # Updates of one field must not overlap
+        keys = [(collection, field_path) for collection, field_path, _ in specs]
+        success_count = run_commands(client, commands, max_parallel, no_wait, keys)
+        print(f"[~] {verb} {success_count}/{total_count} field indexes")
 
     except FileNotFoundError:
         print("[!] Local field-indexes.json not found, skipping")
@@ -164,9 +263,12 @@ def apply_schema_from_directory(client: GCloudClient, schema_dir):
             client,
             local_ttl,
             TTLPolicyOperations.build_create_command,
-            "TTL policy"
+            "TTL policy",
+            max_parallel,
+            no_wait,
+            validate_ttl_policy
         )
-        print(f"[~] Processed {success_count}/{len(local_ttl)} TTL policies")
+        print(f"[~] {verb} {success_count}/{len(local_ttl)} TTL policies")
 
     except FileNotFoundError:
         print("[!] Local ttl-policies.json not found, skipping")
@@ -175,9 +277,20 @@ def apply_schema_from_directory(client: GCloudClient, schema_dir):
         logger.exception("Failed to apply TTL policies")
 
 
-def main():
-    """Main entry point for firesync apply command."""
-    args = parse_apply_args("Apply local Firestore schema to remote GCP project")
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for firesync apply command.
+
+    Args:
+        argv: Command arguments without program name (default: sys.argv[1:])
+    """
+    # Configure logging when run as a command, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s: %(message)s"
+    )
+
+    args = parse_apply_args("Apply local Firestore schema to remote GCP project", argv)
 
     # Check if migration mode (--env-from and --env-to)
     if args.env_from and args.env_to:
@@ -198,7 +311,7 @@ def main():
         _, target_client = setup_client(env=args.env_to)
 
         # Apply source schema to target environment
-        apply_schema_from_directory(target_client, source_schema_dir)
+        apply_schema_from_directory(target_client, source_schema_dir, args.max_parallel, args.no_wait)
 
         print(f"\n[+] Migration applied: {args.env_from} schema -> {args.env_to} Firestore")
 
@@ -209,7 +322,7 @@ def main():
             schema_dir=getattr(args, 'schema_dir', None)
         )
 
-        apply_schema_from_directory(client, config.schema_dir)
+        apply_schema_from_directory(client, config.schema_dir, args.max_parallel, args.no_wait)
 
         print("\n[+] Firestore schema applied.")
 
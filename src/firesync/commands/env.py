@@ -4,6 +4,7 @@
 import sys
 import logging
 import argparse
+from typing import List, Optional
 
 from firesync.workspace import (
     load_config,
@@ -11,11 +12,6 @@ from firesync.workspace import (
     remove_environment,
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s: %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
@@ -29,19 +25,23 @@ def cmd_list(args):
             print(f"\nRun 'firesync env add <name> --key-path=<path>' to add an environment.")
             return
 
-        print(f"\nEnvironments in {config.config_path}:\n")
+        # Build the whole listing and write it at once
+        lines = [f"\nEnvironments in {config.config_path}:\n"]
+        config_dir = config.config_dir
         for env_name, env_config in config.environments.items():
             desc = f" - {env_config.description}" if env_config.description else ""
-            print(f"  * {env_name}")
 
             if env_config.key_path:
                 # Show relative path and absolute path in parentheses
-                abs_path = config.config_dir / env_config.key_path
-                print(f"    key_path: {env_config.key_path}{desc} ({abs_path})")
+                lines.append(
+                    f"  * {env_name}\n"
+                    f"    key_path: {env_config.key_path}{desc} ({config_dir / env_config.key_path})"
+                )
             else:
-                print(f"    key_env: {env_config.key_env}{desc}")
+                lines.append(f"  * {env_name}\n    key_env: {env_config.key_env}{desc}")
 
-        print()
+        lines.append("")
+        print("\n".join(lines))
 
     except FileNotFoundError as e:
         print(f"[!] {e}")
@@ -59,28 +59,33 @@ def cmd_show(args):
         config = load_config()
         env_config = config.get_env(args.name)
 
-        print(f"\nEnvironment: {args.name}\n")
+        lines = [f"\nEnvironment: {args.name}\n"]
 
         if env_config.key_path:
-            print(f"  Authentication: key_path")
-            print(f"  Key file:       {env_config.key_path}")
             # Show absolute path
             abs_path = config.config_dir / env_config.key_path
-            print(f"  Absolute path:  {abs_path}")
+            lines.extend([
+                "  Authentication: key_path",
+                f"  Key file:       {env_config.key_path}",
+                f"  Absolute path:  {abs_path}",
+            ])
         else:
-            print(f"  Authentication: key_env")
-            print(f"  Environment variable: {env_config.key_env}")
-            print(f"  (Auto-detects JSON content or file path)")
+            lines.extend([
+                "  Authentication: key_env",
+                f"  Environment variable: {env_config.key_env}",
+                "  (Auto-detects JSON content or file path)",
+            ])
 
         if env_config.description:
-            print(f"  Description:    {env_config.description}")
+            lines.append(f"  Description:    {env_config.description}")
 
         # Show schema directory
         schema_dir = config.get_schema_dir(args.name)
-        print(f"  Schema directory: {schema_dir}")
-        print(f"  Schema exists:    {schema_dir.exists()}")
+        lines.append(f"  Schema directory: {schema_dir}")
+        lines.append(f"  Schema exists:    {schema_dir.exists()}")
 
-        print()
+        lines.append("")
+        print("\n".join(lines))
 
     except FileNotFoundError as e:
         print(f"[!] {e}")
@@ -101,28 +106,26 @@ def cmd_add(args):
     try:
         # Validation is handled by argparse mutually exclusive group
 
-        add_environment(
+        env_config = add_environment(
             env_name=args.name,
             key_path=args.key_path,
             key_env=args.key_env,
             description=args.description
         )
 
-        print(f"\n[+] Environment '{args.name}' added successfully")
+        lines = [f"\n[+] Environment '{args.name}' added successfully"]
 
         # Show what was added
-        config = load_config()
-        env_config = config.get_env(args.name)
-
         if env_config.key_path:
-            print(f"   Key path: {env_config.key_path}")
+            lines.append(f"   Key path: {env_config.key_path}")
         else:
-            print(f"   Key env:  {env_config.key_env}")
+            lines.append(f"   Key env:  {env_config.key_env}")
 
         if env_config.description:
-            print(f"   Description: {env_config.description}")
+            lines.append(f"   Description: {env_config.description}")
 
-        print()
+        lines.append("")
+        print("\n".join(lines))
 
     except FileNotFoundError as e:
         print(f"[!] {e}")
@@ -174,8 +177,19 @@ def cmd_remove(args):
         sys.exit(1)
 
 
-def main():
-    """Main entry point for firesync env command."""
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for firesync env command.
+
+    Args:
+        argv: Command arguments without program name (default: sys.argv[1:])
+    """
+    # Configure logging when run as a command, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s: %(message)s"
+    )
+
     parser = argparse.ArgumentParser(
         description='Manage FireSync workspace environments'
     )
@@ -206,7 +220,7 @@ def main():
     remove_parser.add_argument('--force', action='store_true', help='Skip confirmation')
     remove_parser.set_defaults(func=cmd_remove)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.subcommand:
         parser.print_help()
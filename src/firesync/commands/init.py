@@ -6,18 +6,19 @@ import logging
 from typing import Optional
 from pathlib import Path
 
-from firesync.workspace import init_workspace, CONFIG_DIR_NAME
+from firesync.workspace import init_workspace
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s: %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
 def main(target_path: Optional[str] = None):
     """Main entry point for firesync init command."""
+    # Configure logging when run as a command, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s: %(message)s"
+    )
+
     try:
         target_dir = Path(target_path) if target_path else None
         config_path = init_workspace(target_dir)
@@ -3,7 +3,8 @@
 
 import logging
 import sys
-from typing import Callable, List, Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Any, Dict, Optional, Tuple
 from pathlib import Path
 
 from firesync.cli import parse_plan_args, setup_client
@@ -15,20 +16,61 @@ from firesync.operations import (
 from firesync.schema import SchemaFile, load_schema_file
 from firesync.workspace import load_config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s: %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
+def format_composite_index(item: Tuple) -> str:
+    """Format composite index diff item (collection, query_scope, fields)."""
+    return f"{item[0]} {item[1]} {' | '.join(item[2])}"
+
+
+def format_field_index(item: Tuple) -> str:
+    """Format field index diff item (collection, field_path, value)."""
+    return f"FIELD INDEX: ({item[0]}, {item[1]}) => {item[2]}"
+
+
+def format_ttl(item: Tuple) -> str:
+    """Format TTL diff item (collection, field, period) or (collection, field, old, new)."""
+    if len(item) == 3:  # create/delete
+        return f"TTL: ({item[0]}, {item[1]}) => {item[2]}"
+    return f"TTL: ({item[0]}, {item[1]}) {item[2]} -> {item[3]}"  # update
+
+
+def print_diff(
+    diff: Dict[str, Any],
+    format_func: Callable[[Any], str],
+    quiet: bool = False
+) -> None:
+    """
+    Print planned changes in a single write.
+
+    Args:
+        diff: Dictionary with 'create', 'delete' and optional 'update' items
+        format_func: Function to format diff items for display
+        quiet: If True, print only the number of changes per kind
+    """
+    if quiet:
+        counts = [(len(diff.get(key, ())), key) for key in ("create", "delete", "update")]
+        if any(count for count, _ in counts):
+            print("[~] " + ", ".join(f"{count} to {key}" for count, key in counts))
+        else:
+            print("[~] No changes")
+        return
+
+    lines = [f"[+] WILL CREATE: {format_func(item)}" for item in diff.get("create", ())]
+    lines.extend(f"[-] WILL DELETE: {format_func(item)}" for item in diff.get("delete", ()))
+    lines.extend(f"[~] WILL UPDATE: {format_func(item)}" for item in diff.get("update", ()))
+
+    print("\n".join(lines) if lines else "[~] No changes")
+
+
 def compare_and_display(
     resource_name: str,
     schema_file: Path,
     fetch_remote: Callable[[], List[Dict[str, Any]]],
     compare_func: Callable[[List, List], Dict],
-    format_func: Callable[[Any], str]
+    format_func: Callable[[Any], str],
+    quiet: bool = False
 ) -> None:
     """
     Compare local and remote resources and display differences.
@@ -39,6 +81,7 @@ def compare_and_display(
         fetch_remote: Function to fetch remote resources
         compare_func: Function to compare local vs remote
         format_func: Function to format diff items for display
+        quiet: If True, print only the number of changes per kind
     """
     print(f"\n[~] Comparing {resource_name}")
     try:
@@ -46,15 +89,7 @@ def compare_and_display(
         local = load_schema_file(schema_file)
         diff = compare_func(local, remote)
 
-        for item in diff.get("create", []):
-            print(f"[+] WILL CREATE: {format_func(item)}")
-        for item in diff.get("delete", []):
-            print(f"[-] WILL DELETE: {format_func(item)}")
-        for item in diff.get("update", []):
-            print(f"[~] WILL UPDATE: {format_func(item)}")
-
-        if not any(diff.get(key, []) for key in ["create", "delete", "update"]):
-            print("[~] No changes")
+        print_diff(diff, format_func, quiet)
 
     except FileNotFoundError:
         print(f"[!] Local {schema_file.name} not found")
@@ -68,7 +103,8 @@ def compare_local_schemas(
     source_schema_file: Path,
     target_schema_file: Path,
     compare_func: Callable[[List, List], Dict],
-    format_func: Callable[[Any], str]
+    format_func: Callable[[Any], str],
+    quiet: bool = False
 ) -> None:
     """
     Compare two local schema files (migration mode).
@@ -79,6 +115,7 @@ def compare_local_schemas(
         target_schema_file: Path to target environment schema
         compare_func: Function to compare schemas
         format_func: Function to format diff items for display
+        quiet: If True, print only the number of changes per kind
     """
     print(f"\n[~] Comparing {resource_name}")
     try:
@@ -86,15 +123,7 @@ def compare_local_schemas(
         target = load_schema_file(target_schema_file)
         diff = compare_func(source, target)
 
-        for item in diff.get("create", []):
-            print(f"[+] WILL CREATE: {format_func(item)}")
-        for item in diff.get("delete", []):
-            print(f"[-] WILL DELETE: {format_func(item)}")
-        for item in diff.get("update", []):
-            print(f"[~] WILL UPDATE: {format_func(item)}")
-
-        if not any(diff.get(key, []) for key in ["create", "delete", "update"]):
-            print("[~] No changes")
+        print_diff(diff, format_func, quiet)
 
     except FileNotFoundError as e:
         print(f"[!] Schema file not found: {e}")
@@ -103,9 +132,20 @@ def compare_local_schemas(
         logger.exception(f"{resource_name} comparison failed")
 
 
-def main():
-    """Main entry point for firesync plan command."""
-    args = parse_plan_args("Compare local Firestore schema against remote state")
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for firesync plan command.
+
+    Args:
+        argv: Command arguments without program name (default: sys.argv[1:])
+    """
+    # Configure logging when run as a command, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s: %(message)s"
+    )
+
+    args = parse_plan_args("Compare local Firestore schema against remote state", argv)
 
     # Check if migration mode (--env-from and --env-to)
     if args.env_from and args.env_to:
@@ -124,20 +164,14 @@ def main():
         print(f"   Source: {source_schema_dir}")
         print(f"   Target: {target_schema_dir}")
 
-        # Format functions
-        def format_ttl(item):
-            if len(item) == 3:  # create/delete
-                return f"TTL: ({item[0]}, {item[1]}) => {item[2]}"
-            else:  # update
-                return f"TTL: ({item[0]}, {item[1]}) {item[2]} -> {item[3]}"
-
         # Compare Composite Indexes
         compare_local_schemas(
             "Composite Indexes",
             source_schema_dir / SchemaFile.COMPOSITE_INDEXES,
             target_schema_dir / SchemaFile.COMPOSITE_INDEXES,
             CompositeIndexOperations.compare,
-            lambda item: f"{item[0]} {item[1]} {' | '.join(item[2])}"
+            format_composite_index,
+            args.quiet
         )
 
         # Compare Single-Field Indexes
@@ -146,7 +180,8 @@ def main():
             source_schema_dir / SchemaFile.FIELD_INDEXES,
             target_schema_dir / SchemaFile.FIELD_INDEXES,
             FieldIndexOperations.compare,
-            lambda item: f"FIELD INDEX: ({item[0]}, {item[1]}) => {item[2]}"
+            format_field_index,
+            args.quiet
         )
 
         # Compare TTL Policies
@@ -155,7 +190,8 @@ def main():
             source_schema_dir / SchemaFile.TTL_POLICIES,
             target_schema_dir / SchemaFile.TTL_POLICIES,
             TTLPolicyOperations.compare,
-            format_ttl
+            format_ttl,
+            args.quiet
         )
 
         print("\n[+] Migration plan complete.")
@@ -167,39 +203,42 @@ def main():
             schema_dir=getattr(args, 'schema_dir', None)
         )
 
-        # Format functions
-        def format_ttl(item):
-            if len(item) == 3:  # create/delete
-                return f"TTL: ({item[0]}, {item[1]}) => {item[2]}"
-            else:  # update
-                return f"TTL: ({item[0]}, {item[1]}) {item[2]} -> {item[3]}"
-
-        # Compare Composite Indexes
-        compare_and_display(
-            "Composite Indexes",
-            config.schema_dir / SchemaFile.COMPOSITE_INDEXES,
-            client.list_composite_indexes,
-            CompositeIndexOperations.compare,
-            lambda item: f"{item[0]} {item[1]} {' | '.join(item[2])}"
-        )
-
-        # Compare Single-Field Indexes
-        compare_and_display(
-            "Single-Field Indexes",
-            config.schema_dir / SchemaFile.FIELD_INDEXES,
-            client.list_field_indexes,
-            FieldIndexOperations.compare,
-            lambda item: f"FIELD INDEX: ({item[0]}, {item[1]}) => {item[2]}"
-        )
-
-        # Compare TTL Policies
-        compare_and_display(
-            "TTL Policies",
-            config.schema_dir / SchemaFile.TTL_POLICIES,
-            client.list_ttl_policies,
-            TTLPolicyOperations.compare,
-            format_ttl
-        )
+        # Fetch all remote resources concurrently, gcloud startup and network
+        # latency dominate each call
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            remote_composite = executor.submit(client.list_composite_indexes)
+            remote_fields = executor.submit(client.list_field_indexes)
+            remote_ttl = executor.submit(client.list_ttl_policies)
+
+            # Compare Composite Indexes
+            compare_and_display(
+                "Composite Indexes",
+                config.composite_path,
+                remote_composite.result,
+                CompositeIndexOperations.compare,
+                format_composite_index,
+                args.quiet
+            )
+
+            # Compare Single-Field Indexes
+            compare_and_display(
+                "Single-Field Indexes",
+                config.field_path,
+                remote_fields.result,
+                FieldIndexOperations.compare,
+                format_field_index,
+                args.quiet
+            )
+
+            # Compare TTL Policies
+            compare_and_display(
+                "TTL Policies",
+                config.ttl_path,
+                remote_ttl.result,
+                TTLPolicyOperations.compare,
+                format_ttl,
+                args.quiet
+            )
 
         print("\n[+] Plan complete.")
 
@@ -1,50 +1,126 @@
 #!/usr/bin/env python3
 """Export Firestore schema from GCP to local JSON files."""
 
+import io
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, List, Optional, TextIO
 
 from firesync.cli import parse_pull_args, setup_client
-from firesync.schema import SchemaFile, ensure_schema_dir
+from firesync.schema import ensure_schema_dir
 from firesync.workspace import load_config
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s: %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
-def pull_single_environment(env_name):
-    """Pull schema for a single environment."""
-    config, client = setup_client(env=env_name)
+def pull_single_environment(env_name: str, output: Optional[TextIO] = None) -> bool:
+    """
+    Pull schema for a single environment.
+
+    Args:
+        env_name: Environment name from workspace config
+        output: Stream for progress messages (default: sys.stdout). When
+            given, schema files are exported one after another so the
+            messages stay in order.
+
+    Returns:
+        True when all schema files were exported
+
+    Raises:
+        SystemExit: If the environment cannot be set up or an export fails
+    """
+    config, client = setup_client(env=env_name, output=output)
+
+    # Remove a temporary key file as soon as this environment is done,
+    # pull --all would otherwise keep one per environment until exit
+    with config:
+        # Ensure schema directory exists
+        ensure_schema_dir(config.schema_dir)
+
+        print(file=output)
+        exports = [
+            (["firestore", "indexes", "composite", "list"], config.composite_path),
+            (["firestore", "indexes", "fields", "list"], config.field_path),
+            (["firestore", "fields", "ttls", "list"], config.ttl_path),
+        ]
+        if output is None:
+            # Run the three gcloud list calls concurrently
+            with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+                futures = [
+                    executor.submit(client.export_to_file, cmd, output_file)
+                    for cmd, output_file in exports
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for cmd, output_file in exports:
+                client.export_to_file(cmd, output_file)
+
+    print(f"[+] Firestore schema exported to: {config.schema_dir}", file=output)
+    return True
 
-    # Ensure schema directory exists
-    ensure_schema_dir(config.schema_dir)
 
-    # Export all schema files
-    print()
-    client.export_to_file(
-        ["firestore", "indexes", "composite", "list"],
-        config.schema_dir / SchemaFile.COMPOSITE_INDEXES
-    )
-    client.export_to_file(
-        ["firestore", "indexes", "fields", "list"],
-        config.schema_dir / SchemaFile.FIELD_INDEXES
-    )
-    client.export_to_file(
-        ["firestore", "fields", "ttls", "list"],
-        config.schema_dir / SchemaFile.TTL_POLICIES
-    )
+def pull_environments(env_names: Iterable[str], parallel: int) -> List[str]:
+    """
+    Pull schemas for several environments concurrently.
+
+    Environments are independent of each other, each one uses its own
+    gcloud client and writes to its own schema directory. Output of each
+    environment is buffered and printed under its header once it is done,
+    so concurrent pulls don't interleave.
+
+    Args:
+        env_names: Environment names from workspace config
+        parallel: Maximum number of environments to pull at the same time
+
+    Returns:
+        Names of environments that failed to pull, in input order
+    """
+    env_names = list(env_names)
+    buffers = {name: io.StringIO() for name in env_names}
+    failed = set()
+
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        futures = {
+            executor.submit(pull_single_environment, name, buffers[name]): name
+            for name in env_names
+        }
+        for idx, future in enumerate(as_completed(futures), 1):
+            env_name = futures[future]
+            print(f"[{idx}/{len(env_names)}] Pulling environment: {env_name}")
+            print("-" * 60)
+            print(buffers[env_name].getvalue(), end="")
+            try:
+                future.result()
+                print(f"[+] Pulled environment: {env_name}")
+            except SystemExit:
+                # The reason was already printed to the environment's output
+                print(f"[!] Failed to pull {env_name}")
+                failed.add(env_name)
+            except Exception as e:
+                print(f"[!] Failed to pull {env_name}: {e}")
+                logger.exception("Failed to pull environment %s", env_name)
+                failed.add(env_name)
+            print()
 
-    print(f"[+] Firestore schema exported to: {config.schema_dir}")
-    return True
+    return [name for name in env_names if name in failed]
 
 
-def main():
-    """Main entry point for firesync pull command."""
-    args = parse_pull_args("Export Firestore schema from GCP to local JSON files")
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for firesync pull command.
+
+    Args:
+        argv: Command arguments without program name (default: sys.argv[1:])
+    """
+    # Configure logging when run as a command, not on import
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s: %(message)s"
+    )
+
+    args = parse_pull_args("Export Firestore schema from GCP to local JSON files", argv)
 
     # Handle --all mode
     if getattr(args, 'all', False):
@@ -60,22 +136,10 @@ def main():
             sys.exit(1)
 
         env_count = len(workspace_config.environments)
-        print(f"\nPulling schemas from {env_count} environment(s)...\n")
+        print(f"\nPulling schemas from {env_count} environment(s), up to {args.parallel} at a time...\n")
 
-        success_count = 0
-        failed_envs = []
-
-        for idx, env_name in enumerate(workspace_config.environments.keys(), 1):
-            print(f"[{idx}/{env_count}] Pulling environment: {env_name}")
-            print("-" * 60)
-            try:
-                pull_single_environment(env_name)
-                success_count += 1
-            except Exception as e:
-                print(f"[!] Failed to pull {env_name}: {e}")
-                logger.exception(f"Failed to pull environment {env_name}")
-                failed_envs.append(env_name)
-            print()
+        failed_envs = pull_environments(workspace_config.environments.keys(), args.parallel)
+        success_count = env_count - len(failed_envs)
 
         # Summary
         print("=" * 60)
@@ -1,15 +1,59 @@
 """Configuration management for FireSync."""
 
+import copy
 import json
 import os
 import sys
 import tempfile
+import weakref
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Optional, TextIO, Tuple
 
+from firesync import jsonio
+from firesync.cache import FileCache
+from firesync.schema import SchemaFile
 
-@dataclass
+# Parsed key files, invalidated when the file changes on disk
+_KEY_FILE_CACHE = FileCache()
+
+# Memory-backed directory for temporary key files, so credentials never
+# reach a disk (None uses the default temp directory)
+_TEMP_KEY_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK | os.X_OK) else None
+
+
+def _parse_key_file(path: Path) -> Any:
+    """Parse service account key file."""
+    return jsonio.loads(path.read_bytes())
+
+
+def _read_key_file(path: Path) -> Any:
+    """
+    Read service account key file, reusing the parsed data if the file is unchanged.
+
+    Args:
+        path: Path to key file
+
+    Returns:
+        Copy of the parsed key data
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return copy.copy(_KEY_FILE_CACHE.get(path, _parse_key_file))
+
+
+def _remove_temp_file(path: str) -> None:
+    """Remove temporary key file, ignoring files that are already gone."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass  # Ignore cleanup errors
+
+
+@dataclass(frozen=True)
 class FiresyncConfig:
     """Configuration for FireSync operations."""
 
@@ -19,13 +63,55 @@ class FiresyncConfig:
     schema_dir: Path
     _temp_key_file: Optional[str] = None  # For cleanup of temp files
 
+    def __post_init__(self):
+        """Schedule removal of the temporary key file."""
+        # Runs on close(), when the config is garbage collected or at
+        # interpreter exit, whichever comes first, and at most once
+        finalizer = None
+        if self._temp_key_file:
+            finalizer = weakref.finalize(self, _remove_temp_file, self._temp_key_file)
+        object.__setattr__(self, "_finalizer", finalizer)
+
+    def close(self) -> None:
+        """Remove the temporary key file now instead of at garbage collection."""
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def __enter__(self) -> "FiresyncConfig":
+        """Use config as a context manager that removes its temporary key file."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Remove the temporary key file."""
+        self.close()
+
+    # Schema file paths, joined once per config instead of on every access.
+    # cached_property stores into the instance __dict__ directly, which
+    # bypasses the frozen dataclass __setattr__
+
+    @cached_property
+    def composite_path(self) -> Path:
+        """Path to the composite indexes schema file."""
+        return self.schema_dir / SchemaFile.COMPOSITE_INDEXES
+
+    @cached_property
+    def field_path(self) -> Path:
+        """Path to the single-field indexes schema file."""
+        return self.schema_dir / SchemaFile.FIELD_INDEXES
+
+    @cached_property
+    def ttl_path(self) -> Path:
+        """Path to the TTL policies schema file."""
+        return self.schema_dir / SchemaFile.TTL_POLICIES
+
     @classmethod
     def from_args(
         cls,
         key_path: Optional[str] = None,
         key_env: Optional[str] = None,
         key_path_env: Optional[str] = None,
-        schema_dir: str = "firestore_schema"
+        schema_dir: str = "firestore_schema",
+        output: Optional[TextIO] = None
     ) -> "FiresyncConfig":
         """
         Create configuration from command-line arguments.
@@ -35,6 +121,7 @@ class FiresyncConfig:
             key_env: Name of environment variable containing key JSON content
             key_path_env: Name of environment variable containing path to key file
             schema_dir: Directory containing schema JSON files
+            output: Stream for messages (default: sys.stdout)
 
         Returns:
             FiresyncConfig instance
@@ -43,18 +130,21 @@ class FiresyncConfig:
             SystemExit: If key file is invalid or missing
         """
         # Get key data from either file or environment variable
-        key_data, actual_key_path, temp_file = cls._load_key(key_path, key_env, key_path_env)
+        key_data, actual_key_path, temp_file = cls._load_key(key_path, key_env, key_path_env, output)
 
         # Extract required fields
         try:
             project_id = key_data["project_id"]
             service_account = key_data["client_email"]
         except KeyError as e:
-            print(f"[!] Invalid key format: missing field {e}")
+            print(f"[!] Invalid key format: missing field {e}", file=output)
             sys.exit(1)
 
-        # Resolve schema directory
-        schema_path = (Path.cwd() / schema_dir).resolve()
+        # Resolve schema directory, workspace schema dirs are already
+        # absolute and need no getcwd()
+        if not os.path.isabs(schema_dir):
+            schema_dir = os.path.join(os.getcwd(), schema_dir)
+        schema_path = Path(schema_dir).resolve()
 
         return cls(
             project_id=project_id,
@@ -68,7 +158,8 @@ class FiresyncConfig:
     def _load_key(
         key_path: Optional[str],
         key_env: Optional[str],
-        key_path_env: Optional[str] = None  # Deprecated, kept for compatibility
+        key_path_env: Optional[str] = None,  # Deprecated, kept for compatibility
+        output: Optional[TextIO] = None
     ) -> Tuple[dict, Path, Optional[str]]:
         """
         Load key from file or environment variable.
@@ -77,6 +168,7 @@ class FiresyncConfig:
             key_path: Path to key file
             key_env: Name of environment variable (auto-detects JSON content or file path)
             key_path_env: Deprecated, use key_env instead
+            output: Stream for messages (default: sys.stdout)
 
         Returns:
             Tuple of (key_data dict, actual_key_path, temp_file_path)
@@ -87,78 +179,94 @@ class FiresyncConfig:
 
         # Validate: exactly one must be provided
         if key_path and key_env:
-            print("[!] Cannot specify both --key-path and --key-env")
+            print("[!] Cannot specify both --key-path and --key-env", file=output)
             sys.exit(1)
 
         if not key_path and not key_env:
-            print("[!] Must specify either --key-path or --key-env")
+            print("[!] Must specify either --key-path or --key-env", file=output)
             sys.exit(1)
 
         # Load from file
         if key_path:
             key_file_path = Path(key_path)
-            if not key_file_path.exists():
-                print(f"[!] Key file not found: {key_file_path}")
-                print(f"[!] Please ensure the service account key exists at: {key_file_path.resolve()}")
-                sys.exit(1)
-
+            # The cache lookup stats the file, so a missing key surfaces
+            # as FileNotFoundError without a separate exists() check
             try:
-                key_data = json.loads(key_file_path.read_text(encoding="utf-8"))
+                key_data = _read_key_file(key_file_path)
                 return key_data, key_file_path.resolve(), None
+            except FileNotFoundError:
+                print(f"[!] Key file not found: {key_file_path}", file=output)
+                print(f"[!] Please ensure the service account key exists at: {key_file_path.resolve()}", file=output)
+                sys.exit(1)
             except json.JSONDecodeError as e:
-                print(f"[!] Failed to parse key file: {e}")
+                print(f"[!] Failed to parse key file: {e}", file=output)
                 sys.exit(1)
             except Exception as e:
-                print(f"[!] Failed to read key file: {e}")
+                print(f"[!] Failed to read key file: {e}", file=output)
                 sys.exit(1)
 
         # Load from environment variable (auto-detect JSON content or file path)
         if key_env:
             env_value = os.getenv(key_env)
             if not env_value:
-                print(f"[!] Environment variable {key_env} is not set")
+                print(f"[!] Environment variable {key_env} is not set", file=output)
                 sys.exit(1)
 
-            # Try to parse as JSON first
-            try:
-                key_data = json.loads(env_value)
-                # Successfully parsed as JSON - create temp file for gcloud
+            # Try to parse as JSON first. Key JSON is an object, so values
+            # that cannot start one are file paths and skip the parse attempt
+            key_data = None
+            if env_value.lstrip()[:1] == "{":
                 try:
-                    temp_fd, temp_path = tempfile.mkstemp(suffix=".json", prefix="firesync-key-")
-                    with os.fdopen(temp_fd, 'w') as f:
-                        json.dump(key_data, f)
-                    return key_data, Path(temp_path), temp_path
-                except Exception as e:
-                    print(f"[!] Failed to create temporary key file: {e}")
-                    sys.exit(1)
-            except json.JSONDecodeError:
-                # Not valid JSON - treat as file path
-                key_file_path = Path(env_value)
-                if not key_file_path.exists():
-                    print(f"[!] Key file not found: {key_file_path}")
-                    print(f"[!] Environment variable {key_env} contains neither valid JSON nor a valid file path")
-                    sys.exit(1)
+                    key_data = jsonio.loads(env_value)
+                except json.JSONDecodeError:
+                    pass  # Not valid JSON - treat as file path
 
+            if key_data is not None:
+                # Successfully parsed as JSON - create temp file for gcloud
                 try:
-                    key_data = json.loads(key_file_path.read_text(encoding="utf-8"))
-                    return key_data, key_file_path.resolve(), None
-                except json.JSONDecodeError as e:
-                    print(f"[!] Failed to parse key file {key_file_path}: {e}")
-                    sys.exit(1)
+                    temp_fd, temp_path = tempfile.mkstemp(
+                        suffix=".json", prefix="firesync-key-", dir=_TEMP_KEY_DIR
+                    )
+                    # env_value was just parsed as JSON, write it as is
+                    # instead of serializing key_data again
+                    try:
+                        os.write(temp_fd, env_value.encode("utf-8"))
+                    finally:
+                        os.close(temp_fd)
+                    return key_data, Path(temp_path), temp_path
                 except Exception as e:
-                    print(f"[!] Failed to read key file {key_file_path}: {e}")
+                    print(f"[!] Failed to create temporary key file: {e}", file=output)
                     sys.exit(1)
 
-    def __del__(self):
-        """Clean up temporary key file if created."""
-        if self._temp_key_file and os.path.exists(self._temp_key_file):
+            # Not JSON - treat as file path
+            key_file_path = Path(env_value)
             try:
-                os.unlink(self._temp_key_file)
-            except Exception:
-                pass  # Ignore cleanup errors
-
-    def display_info(self) -> None:
-        """Print configuration information."""
-        print(f"[~] Project: {self.project_id}")
-        print(f"[~] Service Account: {self.service_account}")
-        print(f"[~] Key Path: {self.key_path}")
+                key_data = _read_key_file(key_file_path)
+                return key_data, key_file_path.resolve(), None
+            except FileNotFoundError:
+                print(f"[!] Key file not found: {key_file_path}", file=output)
+                print(
+                    f"[!] Environment variable {key_env} contains neither valid JSON nor a valid file path",
+                    file=output
+                )
+                sys.exit(1)
+            except json.JSONDecodeError as e:
+                print(f"[!] Failed to parse key file {key_file_path}: {e}", file=output)
+                sys.exit(1)
+            except Exception as e:
+                print(f"[!] Failed to read key file {key_file_path}: {e}", file=output)
+                sys.exit(1)
+
+    def display_info(self, output: Optional[TextIO] = None) -> None:
+        """
+        Print configuration information.
+
+        Args:
+            output: Stream to print to (default: sys.stdout)
+        """
+        print(
+            f"[~] Project: {self.project_id}\n"
+            f"[~] Service Account: {self.service_account}\n"
+            f"[~] Key Path: {self.key_path}",
+            file=output
+        )
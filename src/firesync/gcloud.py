@@ -1,13 +1,15 @@
 """GCloud CLI wrapper for Firestore operations."""
 
-import json
 import logging
+import os
 import platform
 import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, TextIO
 
+from firesync import jsonio
 from firesync.config import FiresyncConfig
 
 logger = logging.getLogger(__name__)
@@ -26,46 +28,44 @@ def get_gcloud_binary() -> str:
 class GCloudClient:
     """Client for executing gcloud commands."""
 
-    def __init__(self, config: FiresyncConfig):
+    def __init__(self, config: FiresyncConfig, output: Optional[TextIO] = None):
         """
         Initialize GCloud client.
 
         Args:
             config: FiresyncConfig instance with project and authentication details
+            output: Stream for progress messages (default: sys.stdout)
         """
         self.config = config
+        self.output = output
         self.gcloud_bin = get_gcloud_binary()
         self._authenticated = False
+        self._auth_lock = threading.Lock()
+
+        # Point gcloud at the key file for every command it runs on behalf of
+        # this client, instead of switching the globally active account
+        self._env = dict(os.environ)
+        self._env["CLOUDSDK_AUTH_CREDENTIAL_FILE_OVERRIDE"] = str(config.key_path)
 
     def activate_service_account(self) -> None:
         """
         Activate GCP service account for gcloud commands.
 
-        Raises:
-            SystemExit: If authentication fails
+        Credentials are passed to each gcloud process through the
+        CLOUDSDK_AUTH_CREDENTIAL_FILE_OVERRIDE environment variable, so no
+        separate `gcloud auth activate-service-account` process is spawned
+        and the user's active gcloud account is left untouched.
         """
         if self._authenticated:
             return
 
-        logger.info(f"Activating service account: {self.config.service_account}")
-        print(f"[~] Activating {self.config.service_account} for project {self.config.project_id}")
-
-        cmd = [
-            self.gcloud_bin,
-            "auth",
-            "activate-service-account",
-            self.config.service_account,
-            f"--key-file={self.config.key_path}",
-            f"--project={self.config.project_id}"
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"[!] Failed to activate service account: {result.stderr.strip()}")
-            sys.exit(1)
+        with self._auth_lock:
+            if self._authenticated:
+                return
 
-        self._authenticated = True
-        logger.info("Service account activated successfully")
+            logger.info("Using service account: %s", self.config.service_account)
+            print(f"[~] Using {self.config.service_account} for project {self.config.project_id}", file=self.output)
+            self._authenticated = True
 
     def run_command(
         self,
@@ -97,21 +97,24 @@ class GCloudClient:
         if quiet:
             full_cmd.append("--quiet")
 
-        logger.debug(f"Running: {' '.join(full_cmd)}")
+        logger.debug("Running: %s", full_cmd)
 
-        result = subprocess.run(full_cmd, capture_output=True, text=True)
+        # Output is only read when parsing JSON, otherwise don't pipe it.
+        # It is kept as bytes so the JSON parser skips the str decode.
+        stdout = subprocess.PIPE if capture_json else subprocess.DEVNULL
+        result = subprocess.run(full_cmd, stdout=stdout, stderr=subprocess.PIPE, env=self._env)
 
         if result.returncode != 0:
-            stderr = result.stderr.strip()
-            logger.error(f"Command failed: {stderr}")
-            print(f"[!] gcloud error: {stderr}")
+            stderr = result.stderr.decode("utf-8", errors="replace").strip()
+            logger.error("Command failed: %s", stderr)
+            print(f"[!] gcloud error: {stderr}", file=self.output)
             sys.exit(1)
 
         if capture_json:
             try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError as e:
-                print(f"[!] Failed to parse gcloud JSON output: {e}")
+                return jsonio.loads(result.stdout)
+            except jsonio.JSONDecodeError as e:
+                print(f"[!] Failed to parse gcloud JSON output: {e}", file=self.output)
                 sys.exit(1)
 
         return None
@@ -119,7 +122,8 @@ class GCloudClient:
     def run_command_tolerant(
         self,
         cmd: List[str],
-        quiet: bool = True
+        quiet: bool = True,
+        defer_output: bool = False
     ) -> bool:
         """
         Execute a gcloud command with error tolerance (for apply operations).
@@ -127,6 +131,8 @@ class GCloudClient:
         Args:
             cmd: Command arguments (without 'gcloud' prefix)
             quiet: If True, add --quiet flag
+            defer_output: If True, print the command together with its result
+                once it finishes, so concurrent commands don't interleave
 
         Returns:
             True if successful, False if failed
@@ -138,29 +144,36 @@ class GCloudClient:
         if quiet:
             full_cmd.append("--quiet")
 
-        print(f"[~] {' '.join(full_cmd)}")
-        logger.debug(f"Running: {' '.join(full_cmd)}")
+        cmd_line = " ".join(full_cmd)
+        logger.debug("Running: %s", cmd_line)
+        if not defer_output:
+            print(f"[~] {cmd_line}", file=self.output)
 
-        result = subprocess.run(full_cmd, capture_output=True, text=True)
+        result = subprocess.run(
+            full_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=self._env
+        )
         stderr = result.stderr.strip().lower()
 
         if result.returncode != 0:
             if "already exists" in stderr or "already_exists" in stderr:
-                print(f"[~] Skipped (already exists)")
+                status, ok = "[~] Skipped (already exists)", True
                 logger.info("Resource already exists, skipping")
-                return True
             elif "permission denied" in stderr or "permission" in stderr:
-                print(f"[!] Permission denied: {stderr}")
-                logger.error(f"Permission denied: {stderr}")
-                return False
+                status, ok = f"[!] Permission denied: {stderr}", False
+                logger.error("Permission denied: %s", stderr)
             else:
-                print(f"[!] Failed: {stderr}")
-                logger.error(f"Command failed: {stderr}")
-                return False
+                status, ok = f"[!] Failed: {stderr}", False
+                logger.error("Command failed: %s", stderr)
         else:
-            print("[+] Success")
+            status, ok = "[+] Success", True
             logger.info("Command succeeded")
-            return True
+
+        if defer_output:
+            # Command and result in one write, so parallel runs don't interleave them
+            print(f"[~] {cmd_line}\n{status}", file=self.output)
+        else:
+            print(status, file=self.output)
+        return ok
 
     def export_to_file(self, cmd: List[str], output_path: Path) -> None:
         """
@@ -182,14 +195,16 @@ class GCloudClient:
             f"--project={self.config.project_id}"
         ]
 
-        logger.debug(f"Exporting to {output_path}: {' '.join(full_cmd)}")
-        print(f"[+] Exporting {output_path.name}")
+        logger.debug("Exporting to %s: %s", output_path, full_cmd)
+        print(f"[+] Exporting {output_path.name}", file=self.output)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            result = subprocess.run(full_cmd, stdout=f, stderr=subprocess.PIPE, text=True)
+        # gcloud writes straight into the file, output never passes through Python
+        with open(output_path, "wb") as f:
+            result = subprocess.run(full_cmd, stdout=f, stderr=subprocess.PIPE, env=self._env)
 
         if result.returncode != 0:
-            print(f"[!] Export failed: {result.stderr.strip()}")
+            stderr = result.stderr.decode("utf-8", errors="replace").strip()
+            print(f"[!] Export failed: {stderr}", file=self.output)
             sys.exit(1)
 
     # Convenience methods for common operations
@@ -0,0 +1,54 @@
+"""JSON parsing for FireSync with optional orjson acceleration."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+# catch the same exception regardless of the backend in use
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON document.
+
+    Uses orjson when installed (pip install firestore-schema-migration[fast]),
+    falling back to the standard library json module.
+
+    Args:
+        data: UTF-8 encoded bytes or str with JSON content
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(data: Any) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON indented with 2 spaces.
+
+    Output matches json.dumps(data, indent=2, ensure_ascii=False).
+
+    Args:
+        data: JSON serializable data
+
+    Returns:
+        UTF-8 encoded JSON document
+
+    Raises:
+        TypeError: If data is not JSON serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
@@ -1,14 +1,37 @@
 #!/usr/bin/env python3
 """FireSync CLI - Unified command-line interface."""
 
-import argparse
 import sys
+from functools import lru_cache
+from importlib import import_module
+from typing import TYPE_CHECKING, List
 
 from firesync import __version__
 
+if TYPE_CHECKING:
+    import argparse
+
+
+# Options shared by plan and apply as (flag, namespace attribute, help)
+_MIGRATION_OPTIONS = (
+    ('--env-from', 'env_from', 'Source environment (migration mode)'),
+    ('--env-to', 'env_to', 'Target environment (migration mode)'),
+    ('--env', 'env', 'Environment name from workspace config'),
+    ('--schema-dir', 'schema_dir', 'Schema directory (overrides workspace config)'),
+)
+
+
+def _add_migration_options(parser: "argparse.ArgumentParser") -> None:
+    """Add the options shared by plan and apply to a subcommand parser."""
+    for flag, _, help_text in _MIGRATION_OPTIONS:
+        parser.add_argument(flag, help=help_text)
+
 
 def create_parser():
     """Create an argument parser with subcommands."""
+    # Imported here so a bare --version does not import argparse
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog='firesync',
         description='Infrastructure as Code for Google Cloud Firestore'
@@ -34,35 +57,74 @@ def create_parser():
     pull_key_group = pull_parser.add_mutually_exclusive_group(required=True)
     pull_key_group.add_argument('--all', action='store_true', help='Pull all environments from workspace')
     pull_key_group.add_argument('--env', help='Environment name from workspace config')
+    pull_parser.add_argument('--parallel', type=int, help='Maximum number of environments to pull in parallel with --all')
 
     # Plan command
     plan_parser = subparsers.add_parser('plan', help='Compare local vs remote schema')
-    plan_parser.add_argument('--env-from', help='Source environment (migration mode)')
-    plan_parser.add_argument('--env-to', help='Target environment (migration mode)')
-    plan_parser.add_argument('--env', help='Environment name from workspace config')
-    plan_parser.add_argument('--schema-dir', help='Schema directory (overrides workspace config)')
+    _add_migration_options(plan_parser)
+    plan_parser.add_argument('--quiet', action='store_true', help='Print only the number of changes per resource type')
 
     # Apply command
     apply_parser = subparsers.add_parser('apply', help='Apply local schema to Firestore')
-    apply_parser.add_argument('--env-from', help='Source environment (migration mode)')
-    apply_parser.add_argument('--env-to', help='Target environment (migration mode)')
-    apply_parser.add_argument('--env', help='Environment name from workspace config')
-    apply_parser.add_argument('--schema-dir', help='Schema directory (overrides workspace config)')
+    _add_migration_options(apply_parser)
+    apply_parser.add_argument('--max-parallel', type=int, help='Maximum number of gcloud commands to run in parallel')
+    apply_parser.add_argument('--async', dest='no_wait', action='store_true', help='Do not wait for operations to complete (skips fields with multiple indexes)')
 
     return parser
 
 
+@lru_cache(maxsize=None)
+def _get_parser() -> "argparse.ArgumentParser":
+    """Get the top-level argument parser, built once per process."""
+    return create_parser()
+
+
+# Options forwarded to each command as (flag, namespace attribute)
+_MIGRATION_FLAGS = tuple((flag, attr) for flag, attr, _ in _MIGRATION_OPTIONS)
+
+FLAG_MAP = {
+    'pull': (('--all', 'all'), ('--env', 'env'), ('--parallel', 'parallel')),
+    'plan': _MIGRATION_FLAGS + (('--quiet', 'quiet'),),
+    'apply': _MIGRATION_FLAGS + (('--max-parallel', 'max_parallel'), ('--async', 'no_wait')),
+}
+
+
+def forward_args(args: "argparse.Namespace", command: str) -> List[str]:
+    """
+    Rebuild command-line arguments for a subcommand from parsed arguments.
+
+    Args:
+        args: Arguments parsed by the top-level parser
+        command: Subcommand name (key of FLAG_MAP)
+
+    Returns:
+        Argument list without program name
+    """
+    forwarded = []
+    for flag, attr in FLAG_MAP[command]:
+        value = getattr(args, attr, None)
+        if isinstance(value, bool):
+            if value:
+                forwarded.append(flag)
+        elif value is not None:
+            forwarded.extend([flag, str(value)])
+    return forwarded
+
+
 def main():
     """Main CLI entry point."""
+    # Answer a bare --version without building the parser
+    if sys.argv[1:] == ['--version']:
+        print(f'firesync {__version__}')
+        return
+
     # Special handling for 'env' command - pass through directly
     if len(sys.argv) > 1 and sys.argv[1] == 'env':
-        # Remove 'env' from argv and call env command directly
-        sys.argv = [sys.argv[0]] + sys.argv[2:]
         from firesync.commands.env import main as env_main
-        env_main()
+        env_main(sys.argv[2:])
         return
 
-    parser = create_parser()
+    parser = _get_parser()
     args = parser.parse_args()
 
     if not args.command:
@@ -73,42 +135,10 @@ def main():
         from firesync.commands.init import main as init_main
         init_main(getattr(args, 'path', None))
 
-    elif args.command == 'pull':
-        # Reconstruct args for pull command
-        pull_args = [sys.argv[0]]
-        if hasattr(args, 'all') and args.all:
-            pull_args.append('--all')
-        elif hasattr(args, 'env') and args.env:
-            pull_args.extend(['--env', args.env])
-        sys.argv = pull_args
-        from firesync.commands.pull import main as pull_main
-        pull_main()
-
-    elif args.command == 'plan':
-        # Reconstruct args for plan command
-        plan_args = [sys.argv[0]]
-        if hasattr(args, 'env_from') and args.env_from and hasattr(args, 'env_to') and args.env_to:
-            plan_args.extend(['--env-from', args.env_from, '--env-to', args.env_to])
-        elif hasattr(args, 'env') and args.env:
-            plan_args.extend(['--env', args.env])
-        if hasattr(args, 'schema_dir') and args.schema_dir:
-            plan_args.extend(['--schema-dir', args.schema_dir])
-        sys.argv = plan_args
-        from firesync.commands.plan import main as plan_main
-        plan_main()
-
-    elif args.command == 'apply':
-        # Reconstruct args for apply command
-        apply_args = [sys.argv[0]]
-        if hasattr(args, 'env_from') and args.env_from and hasattr(args, 'env_to') and args.env_to:
-            apply_args.extend(['--env-from', args.env_from, '--env-to', args.env_to])
-        elif hasattr(args, 'env') and args.env:
-            apply_args.extend(['--env', args.env])
-        if hasattr(args, 'schema_dir') and args.schema_dir:
-            apply_args.extend(['--schema-dir', args.schema_dir])
-        sys.argv = apply_args
-        from firesync.commands.apply import main as apply_main
-        apply_main()
+    elif args.command in FLAG_MAP:
+        # Hand the options to the command's own parser, which validates them
+        module = import_module(f'firesync.commands.{args.command}')
+        module.main(forward_args(args, args.command))
 
 
 if __name__ == '__main__':
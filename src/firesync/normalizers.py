@@ -1,7 +1,11 @@
 """Normalization functions for Firestore schema comparison."""
 
+import re
 from typing import Dict, List, Optional
 
+# Collection group segment of a resource name path
+_COLLECTION_GROUP_RE = re.compile(r"/collectionGroups/([^/]*)")
+
 
 def normalize_collection_name(item: Dict) -> Optional[str]:
     """
@@ -28,11 +32,9 @@ def normalize_collection_name(item: Dict) -> Optional[str]:
         return coll
 
     # Parse from resource name path
-    name = item.get("name", "")
-    if "/collectionGroups/" in name:
-        parts = name.split("/collectionGroups/")
-        if len(parts) > 1:
-            return parts[1].split("/")[0]
+    match = _COLLECTION_GROUP_RE.search(item.get("name", ""))
+    if match:
+        return match.group(1)
 
     return None
 
@@ -59,9 +61,9 @@ def normalize_field_path(item: Dict) -> Optional[str]:
         return field
 
     # Parse from resource name path
-    name = item.get("name", "")
-    if "/fields/" in name:
-        return name.split("/fields/")[-1]
+    _, sep, field = item.get("name", "").rpartition("/fields/")
+    if sep:
+        return field
 
     return None
 
@@ -104,7 +106,9 @@ def normalize_fields(fields: List[Dict]) -> List[str]:
         ... ])
         ['age:descending', 'name:ascending']
     """
-    return sorted(normalize_field_config(f) for f in fields)
+    normalized = [normalize_field_config(f) for f in fields]
+    normalized.sort()
+    return normalized
 
 
 def normalize_index_value(config: Dict) -> Optional[str]:
@@ -65,9 +65,13 @@ class CompositeIndexOperations:
         for idx in remote:
             remote_set.add(CompositeIndexOperations.normalize(idx))
 
+        # Single pass over the differing indexes, then split by side
+        changed = local_set ^ remote_set
+        create = {idx for idx in changed if idx in local_set}
+
         return {
-            "create": local_set - remote_set,
-            "delete": remote_set - local_set,
+            "create": create,
+            "delete": changed - create,
             "update": set()  # Composite indexes don't support updates
         }
 
@@ -162,25 +166,29 @@ class FieldIndexOperations:
                 if value:
                     local_map[(collection, field_path)].add(value)
 
+        # Whole-map equality is a single C-level pass, skip the diff when
+        # nothing changed (the common case)
+        if local_map == remote_map:
+            return {"create": [], "delete": []}
+
         create_list = []
         delete_list = []
 
-        # Find indexes to create
-        for key in local_map.keys() - remote_map.keys():
-            for value in local_map[key]:
-                create_list.append((*key, value))
-
-        # Find indexes to delete
-        for key in remote_map.keys() - local_map.keys():
-            for value in remote_map[key]:
-                delete_list.append((*key, value))
+        # Fields present on one side only: create or delete all their indexes
+        for key in local_map.keys() ^ remote_map.keys():
+            if key in local_map:
+                create_list.extend((*key, value) for value in local_map[key])
+            else:
+                delete_list.extend((*key, value) for value in remote_map[key])
 
         # Find differences in common keys
         for key in local_map.keys() & remote_map.keys():
-            for value in local_map[key] - remote_map[key]:
-                create_list.append((*key, value))
-            for value in remote_map[key] - local_map[key]:
-                delete_list.append((*key, value))
+            local_values = local_map[key]
+            for value in local_values ^ remote_map[key]:
+                if value in local_values:
+                    create_list.append((*key, value))
+                else:
+                    delete_list.append((*key, value))
 
         return {
             "create": create_list,
@@ -264,17 +272,21 @@ class TTLPolicyOperations:
             ttl_period = normalize_ttl_period(entry)
             local_map[(collection, field)] = ttl_period
 
+        # Whole-map equality is a single C-level pass, skip the diff when
+        # nothing changed (the common case)
+        if local_map == remote_map:
+            return {"create": [], "delete": [], "update": []}
+
         create_list = []
         delete_list = []
         update_list = []
 
-        # Find policies to create
-        for key in local_map.keys() - remote_map.keys():
-            create_list.append((*key, local_map[key]))
-
-        # Find policies to delete
-        for key in remote_map.keys() - local_map.keys():
-            delete_list.append((*key, remote_map[key]))
+        # Policies present on one side only
+        for key in local_map.keys() ^ remote_map.keys():
+            if key in local_map:
+                create_list.append((*key, local_map[key]))
+            else:
+                delete_list.append((*key, remote_map[key]))
 
         # Find policies to update
         for key in local_map.keys() & remote_map.keys():
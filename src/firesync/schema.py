@@ -1,10 +1,11 @@
 """Schema file loading and validation."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Any, Dict, List
 
+from firesync import jsonio
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,9 +45,8 @@ def load_schema_file(path: Path) -> List[Dict[str, Any]]:
         raise FileNotFoundError(f"Schema file not found: {path}")
 
     try:
-        content = path.read_text(encoding="utf-8")
-        data = json.loads(content)
-    except json.JSONDecodeError as e:
+        data = jsonio.loads(path.read_bytes())
+    except jsonio.JSONDecodeError as e:
         logger.error(f"Invalid JSON in {path}: {e}")
         raise ValueError(f"Invalid JSON in {path}: {e}")
 
@@ -76,8 +76,7 @@ def save_schema_file(path: Path, data: List[Dict[str, Any]]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        content = json.dumps(data, indent=2, ensure_ascii=False)
-        path.write_text(content, encoding="utf-8")
+        path.write_bytes(jsonio.dumps_pretty(data))
         logger.debug(f"Saved {len(data)} items to {path}")
     except OSError as e:
         logger.error(f"Failed to write {path}: {e}")
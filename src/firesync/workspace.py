@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Workspace configuration management for FireSync."""
 
+import copy
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 try:
     import yaml
@@ -14,10 +16,32 @@ except ImportError:
         "Install it with: pip install PyYAML"
     )
 
+from firesync.cache import FileCache
+
 
 CONFIG_DIR_NAME = "firestore-migration"
 CONFIG_FILE_NAME = "config.yaml"
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# config.yaml written by init_workspace
+_CONFIG_TEMPLATE = b"""version: 1
+environments:
+  # Example configurations:
+  # production:
+  #   key_path: ../keys/prod.json        # Direct path to key file
+  #   description: "Production environment"
+  # staging:
+  #   key_env: GCP_STAGING_KEY           # Env var (JSON content OR path to file)
+  #   description: "Staging environment"
+settings:
+  schema_dir: schemas
+"""
+
+# Parsed config.yaml files, invalidated when the file changes on disk
+_CONFIG_CACHE = FileCache()
+
 
 @dataclass
 class EnvironmentConfig:
@@ -47,7 +71,7 @@ class WorkspaceConfig:
     schema_dir: str
     config_path: Path
 
-    @property
+    @cached_property
     def config_dir(self) -> Path:
         """Get the directory containing config.yaml."""
         return self.config_path.parent
@@ -65,12 +89,14 @@ class WorkspaceConfig:
         Raises:
             ValueError: If environment doesn't exist
         """
-        if env_name not in self.environments:
+        # Single lookup on the success path, the message is only built on a miss
+        try:
+            return self.environments[env_name]
+        except KeyError:
             raise ValueError(
                 f"Environment '{env_name}' not found in config. "
                 f"Available: {', '.join(self.environments.keys())}"
-            )
-        return self.environments[env_name]
+            ) from None
 
     def get_schema_dir(self, env_name: str) -> Path:
         """
@@ -102,18 +128,19 @@ def find_config(start_dir: Optional[Path] = None) -> Optional[Path]:
         Path to config.yaml if found, None otherwise
     """
     if start_dir is None:
-        start_dir = Path.cwd()
+        current = os.fspath(Path.cwd())
     else:
-        start_dir = Path(start_dir).resolve()
+        current = os.path.realpath(start_dir)
 
-    current = start_dir
+    # Walk up with plain strings, a Path is only built for the result
+    suffix = os.path.join(CONFIG_DIR_NAME, CONFIG_FILE_NAME)
     while True:
-        config_path = current / CONFIG_DIR_NAME / CONFIG_FILE_NAME
-        if config_path.exists():
-            return config_path
+        config_path = os.path.join(current, suffix)
+        if os.path.exists(config_path):
+            return Path(config_path)
 
         # Stop at filesystem root
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             return None
         current = parent
@@ -143,13 +170,34 @@ def load_config(config_path: Optional[Path] = None) -> WorkspaceConfig:
             )
     else:
         config_path = Path(config_path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
 
+    # Parse only if config.yaml changed since the last load, and hand out
+    # a copy since callers (add_environment, remove_environment) mutate it.
+    # The cache lookup stats the file, which doubles as the existence check
+    try:
+        config = _CONFIG_CACHE.get(config_path, _parse_config)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    return copy.deepcopy(config)
+
+
+def _parse_config(config_path: Path) -> WorkspaceConfig:
+    """
+    Parse and validate config.yaml.
+
+    Args:
+        config_path: Path to config.yaml
+
+    Returns:
+        Validated WorkspaceConfig object
+
+    Raises:
+        ValueError: If config.yaml is invalid
+    """
     # Parse YAML
     try:
         with open(config_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in {config_path}: {e}")
 
@@ -205,6 +253,8 @@ def load_config(config_path: Optional[Path] = None) -> WorkspaceConfig:
     )
 
 
+
+
 def init_workspace(target_dir: Optional[Path] = None) -> Path:
     """
     Initialize a new FireSync workspace.
@@ -232,33 +282,19 @@ def init_workspace(target_dir: Optional[Path] = None) -> Path:
     config_path = workspace_dir / CONFIG_FILE_NAME
     schemas_dir = workspace_dir / "schemas"
 
-    # Check if workspace already exists
-    if workspace_dir.exists():
+    # Create directories, mkdir itself reports an existing workspace
+    try:
+        workspace_dir.mkdir(parents=True, exist_ok=False)
+    except FileExistsError:
         raise FileExistsError(
             f"Workspace already exists at {workspace_dir}. "
             f"Remove it first if you want to reinitialize."
-        )
-
-    # Create directories
-    workspace_dir.mkdir(parents=True, exist_ok=False)
+        ) from None
     schemas_dir.mkdir(exist_ok=False)
 
     # Create config.yaml with template
-    config_template = """version: 1
-environments:
-  # Example configurations:
-  # production:
-  #   key_path: ../keys/prod.json        # Direct path to key file
-  #   description: "Production environment"
-  # staging:
-  #   key_env: GCP_STAGING_KEY           # Env var (JSON content OR path to file)
-  #   description: "Staging environment"
-settings:
-  schema_dir: schemas
-"""
-
-    with open(config_path, 'w') as f:
-        f.write(config_template)
+    with open(config_path, 'xb') as f:
+        f.write(_CONFIG_TEMPLATE)
 
     return config_path
 
@@ -297,6 +333,9 @@ def save_config(config: WorkspaceConfig) -> None:
     with open(config.config_path, 'w') as f:
         yaml.dump(data, f, default_flow_style=False, sort_keys=False)
 
+    # Don't rely on mtime granularity to notice the rewrite
+    _CONFIG_CACHE.invalidate(config.config_path)
+
 
 def add_environment(
     env_name: str,
@@ -304,7 +343,7 @@ def add_environment(
     key_env: Optional[str] = None,
     description: Optional[str] = None,
     config_path: Optional[Path] = None
-) -> None:
+) -> EnvironmentConfig:
     """
     Add a new environment to workspace configuration.
 
@@ -315,6 +354,9 @@ def add_environment(
         description: Optional description of the environment
         config_path: Path to config.yaml (default: search from cwd)
 
+    Returns:
+        Added environment configuration
+
     Raises:
         FileNotFoundError: If config.yaml not found
         ValueError: If environment already exists or invalid parameters
@@ -353,6 +395,8 @@ def add_environment(
     # Save config
     save_config(config)
 
+    return new_env
+
 
 def remove_environment(env_name: str, config_path: Optional[Path] = None) -> None:
     """
@@ -2,12 +2,28 @@
 
 import json
 import tempfile
+import threading
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 
-from firesync.commands.apply import apply_resources, apply_schema_from_directory
-from firesync.schema import SchemaFile
+from firesync.commands.apply import (
+    apply_resources,
+    apply_schema_from_directory,
+    field_index_specs,
+    run_commands,
+)
+from firesync.gcloud import GCloudClient
+from firesync.schema import SchemaFile, validate_ttl_policy
+
+# Schema file content with no resources
+EMPTY_SCHEMA = b"[]"
+
+
+def _is_field_index_call(call):
+    """Check whether a mocked run_command_tolerant call is a field index command."""
+    args = call.args[0]
+    return bool(args) and "indexes" in args and "fields" in args
 
 
 class TestApplyResources(unittest.TestCase):
@@ -15,7 +31,7 @@ class TestApplyResources(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_client = MagicMock()
+        self.mock_client = create_autospec(GCloudClient, instance=True)
         self.mock_build_command = MagicMock()
 
     def test_apply_resources_success(self):
@@ -88,6 +104,71 @@ class TestApplyResources(unittest.TestCase):
         self.assertEqual(self.mock_build_command.call_count, 3)
         self.assertEqual(self.mock_client.run_command_tolerant.call_count, 2)
 
+    def test_apply_resources_validate(self):
+        """Test that a resource rejected by validate is skipped and reported once."""
+        invalid = {"collectionGroup": "users"}
+        resources = [{"collectionGroup": "users", "field": "expireAt", "state": "ACTIVE"}, invalid]
+        self.mock_build_command.return_value = ["gcloud", "command"]
+        self.mock_client.run_command_tolerant.return_value = True
+
+        with patch('builtins.print') as mock_print, self.assertLogs('firesync') as logs:
+            count = apply_resources(
+                self.mock_client,
+                resources,
+                self.mock_build_command,
+                "TTL policy",
+                validate=validate_ttl_policy
+            )
+
+        self.assertEqual(count, 1)
+        self.mock_build_command.assert_called_once_with(resources[0])
+        mock_print.assert_not_called()
+        self.assertEqual(logs.output, [f"WARNING:firesync.schema:Invalid TTL policy: {invalid}"])
+
+    def test_apply_resources_unexpected_error_skipped(self):
+        """Test that any error while building a resource skips only that resource."""
+        resources = [{"name": "resource1"}, "not a dict"]
+
+        def build_cmd(resource):
+            return ["gcloud", resource["name"]]
+
+        self.mock_build_command.side_effect = build_cmd
+        self.mock_client.run_command_tolerant.return_value = True
+
+        with patch('builtins.print') as mock_print:
+            count = apply_resources(
+                self.mock_client,
+                resources,
+                self.mock_build_command,
+                "test resource",
+                validate=lambda r: bool(r.get("name"))
+            )
+
+        self.assertEqual(count, 1)
+        self.mock_build_command.assert_called_once_with({"name": "resource1"})
+        mock_print.assert_called_once_with(
+            "[!] Skipping invalid test resource: 'str' object has no attribute 'get'"
+        )
+
+    def test_apply_resources_errors_printed_once(self):
+        """Test that invalid resources are reported in a single write."""
+        resources = [{"name": "invalid1"}, {"name": "invalid2"}]
+        self.mock_build_command.side_effect = ValueError("Invalid resource")
+
+        with patch('builtins.print') as mock_print:
+            count = apply_resources(
+                self.mock_client,
+                resources,
+                self.mock_build_command,
+                "test resource"
+            )
+
+        self.assertEqual(count, 0)
+        mock_print.assert_called_once_with(
+            "[!] Skipping invalid test resource: Invalid resource\n"
+            "[!] Skipping invalid test resource: Invalid resource"
+        )
+
     def test_apply_resources_empty_list(self):
         """Test applying empty resource list."""
         count = apply_resources(
@@ -102,27 +183,142 @@ class TestApplyResources(unittest.TestCase):
         self.mock_client.run_command_tolerant.assert_not_called()
 
 
+class TestRunCommands(unittest.TestCase):
+    """Tests for run_commands function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_client = create_autospec(GCloudClient, instance=True)
+        self.commands = [["cmd", str(i)] for i in range(5)]
+
+    def test_run_commands_parallel(self):
+        """Test that every command runs and successes are counted."""
+        self.mock_client.run_command_tolerant.side_effect = lambda cmd, defer_output: cmd[1] != "2"
+
+        count = run_commands(self.mock_client, self.commands, max_parallel=4)
+
+        self.assertEqual(count, 4)
+        calls = self.mock_client.run_command_tolerant.call_args_list
+        self.assertEqual(sorted(c[0][0][1] for c in calls), ["0", "1", "2", "3", "4"])
+        # Parallel output is printed per command once it finishes
+        self.assertTrue(all(c[1] == {"defer_output": True} for c in calls))
+
+    def test_run_commands_serial(self):
+        """Test that max_parallel=1 runs commands in order."""
+        self.mock_client.run_command_tolerant.return_value = True
+
+        count = run_commands(self.mock_client, self.commands, max_parallel=1)
+
+        self.assertEqual(count, 5)
+        calls = self.mock_client.run_command_tolerant.call_args_list
+        self.assertEqual([c[0][0] for c in calls], self.commands)
+        self.assertTrue(all(c[1] == {} for c in calls))
+
+    def test_run_commands_same_key_serial(self):
+        """Test that commands sharing a key run in input order."""
+        calls = []
+        lock = threading.Lock()
+
+        def run(cmd, defer_output):
+            with lock:
+                calls.append(cmd)
+            return True
+
+        self.mock_client.run_command_tolerant.side_effect = run
+        keys = ["a", "b", "a", "b", "a"]
+
+        count = run_commands(self.mock_client, self.commands, max_parallel=4, keys=keys)
+
+        self.assertEqual(count, 5)
+        for key in ("a", "b"):
+            expected = [cmd for cmd, k in zip(self.commands, keys) if k == key]
+            self.assertEqual([cmd for cmd in calls if cmd in expected], expected)
+
+    def test_run_commands_no_wait(self):
+        """Test that no_wait appends --async to every command."""
+        self.mock_client.run_command_tolerant.return_value = True
+
+        run_commands(self.mock_client, self.commands, max_parallel=1, no_wait=True)
+
+        for c in self.mock_client.run_command_tolerant.call_args_list:
+            self.assertEqual(c[0][0][-1], "--async")
+        self.assertEqual(self.commands[0], ["cmd", "0"])
+
+    def test_run_commands_empty(self):
+        """Test running empty command list."""
+        self.assertEqual(run_commands(self.mock_client, []), 0)
+        self.mock_client.run_command_tolerant.assert_not_called()
+
+
+class TestFieldIndexSpecs(unittest.TestCase):
+    """Tests for field_index_specs function."""
+
+    def test_specs_from_mixed_formats(self):
+        """Test extracting specs from normalized and raw GCP entries."""
+        entries = [
+            {
+                "collectionGroupId": "users",
+                "fieldPath": "tags",
+                "indexes": [{"arrayConfig": "CONTAINS"}, {"order": "ASCENDING"}]
+            },
+            {
+                "name": "projects/test/databases/(default)/collectionGroups/orders/fields/status",
+                "indexConfig": {
+                    "indexes": [{"fields": [{"fieldPath": "*", "order": "DESCENDING"}]}]
+                }
+            },
+            {
+                "name": "projects/test/databases/(default)/collectionGroups/__default__/fields/*",
+                "indexConfig": {"indexes": [{"order": "ASCENDING"}]}
+            }
+        ]
+
+        self.assertEqual(field_index_specs(entries), [
+            ("users", "tags", "contains"),
+            ("users", "tags", "ascending"),
+            ("orders", "status", "descending"),
+        ])
+
+    def test_invalid_entries_reported(self):
+        """Test that each invalid entry is skipped with its own message."""
+        entries = [
+            {"fieldPath": "email", "indexes": [{"order": "ASCENDING"}]},
+            {"collectionGroupId": "users", "indexes": [{"order": "ASCENDING"}]},
+            {"collectionGroupId": "users", "fieldPath": "email", "indexes": [{}]}
+        ]
+
+        with patch('builtins.print') as mock_print:
+            specs = field_index_specs(entries)
+
+        self.assertEqual(specs, [])
+        self.assertEqual(
+            [c[0][0] for c in mock_print.call_args_list],
+            [f"[!] Skipping invalid field index entry: {entry}" for entry in entries[:2]]
+        )
+
+
 class TestApplyFieldIndexes(unittest.TestCase):
     """Tests for field index application with various formats."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_client = MagicMock()
+        self.mock_client = create_autospec(GCloudClient, instance=True)
         self.mock_client.run_command_tolerant.return_value = True
 
-    def _create_schema_dir(self, tmpdir, field_indexes):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _create_schema_dir(self, field_indexes):
         """Helper to create schema directory with field indexes."""
-        schema_dir = Path(tmpdir) / "schema"
-        schema_dir.mkdir(parents=True)
+        schema_dir = Path(self.temp_dir.name) / "schema"
+        schema_dir.mkdir()
 
         # Create minimal composite indexes and ttl policies (empty)
-        (schema_dir / SchemaFile.COMPOSITE_INDEXES).write_text("[]")
-        (schema_dir / SchemaFile.TTL_POLICIES).write_text("[]")
+        (schema_dir / SchemaFile.COMPOSITE_INDEXES).write_bytes(EMPTY_SCHEMA)
+        (schema_dir / SchemaFile.TTL_POLICIES).write_bytes(EMPTY_SCHEMA)
 
         # Create field indexes file
-        (schema_dir / SchemaFile.FIELD_INDEXES).write_text(
-            json.dumps(field_indexes, indent=2)
-        )
+        (schema_dir / SchemaFile.FIELD_INDEXES).write_text(json.dumps(field_indexes))
 
         return schema_dir
 
@@ -136,19 +332,46 @@ class TestApplyFieldIndexes(unittest.TestCase):
             }
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            schema_dir = self._create_schema_dir(tmpdir, field_indexes)
+        schema_dir = self._create_schema_dir(field_indexes)
+
+        with patch('builtins.print'):
+            apply_schema_from_directory(self.mock_client, schema_dir)
+
+        # Verify field index command was called
+        calls = self.mock_client.run_command_tolerant.call_args_list
+        field_index_count = sum(1 for c in calls if _is_field_index_call(c))
+        self.assertEqual(field_index_count, 1)
+
+    def test_async_skips_multi_index_fields(self):
+        """Test that --async skips fields whose updates would overlap."""
+        field_indexes = [
+            {
+                "collectionGroupId": "users",
+                "fieldPath": "email",
+                "indexes": [{"order": "ASCENDING"}]
+            },
+            {
+                "collectionGroupId": "users",
+                "fieldPath": "tags",
+                "indexes": [{"arrayConfig": "CONTAINS"}, {"order": "ASCENDING"}]
+            }
+        ]
+
+        schema_dir = self._create_schema_dir(field_indexes)
+
+        with patch('builtins.print') as mock_print:
+            apply_schema_from_directory(self.mock_client, schema_dir, no_wait=True)
 
-            with patch('builtins.print'):
-                apply_schema_from_directory(self.mock_client, schema_dir)
+        field_index_calls = [c for c in self.mock_client.run_command_tolerant.call_args_list if _is_field_index_call(c)]
+        self.assertEqual(len(field_index_calls), 1)
+        self.assertIn("email", field_index_calls[0].args[0])
 
-            # Verify field index command was called
-            calls = self.mock_client.run_command_tolerant.call_args_list
-            field_index_calls = [
-                c for c in calls
-                if c[0][0] and "indexes" in c[0][0] and "fields" in c[0][0]
-            ]
-            self.assertEqual(len(field_index_calls), 1)
+        printed = [c.args[0] for c in mock_print.call_args_list]
+        self.assertIn(
+            "[!] Skipping fields with multiple indexes in --async mode, apply them without --async: users.tags",
+            printed
+        )
+        self.assertIn("[~] Started 1/3 field indexes", printed)
 
     def test_apply_raw_gcp_format(self):
         """Test applying field indexes in raw GCP format with name path."""
@@ -164,19 +387,15 @@ class TestApplyFieldIndexes(unittest.TestCase):
             }
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            schema_dir = self._create_schema_dir(tmpdir, field_indexes)
+        schema_dir = self._create_schema_dir(field_indexes)
 
-            with patch('builtins.print'):
-                apply_schema_from_directory(self.mock_client, schema_dir)
+        with patch('builtins.print'):
+            apply_schema_from_directory(self.mock_client, schema_dir)
 
-            # Verify field index commands were called (2 indexes)
-            calls = self.mock_client.run_command_tolerant.call_args_list
-            field_index_calls = [
-                c for c in calls
-                if c[0][0] and "indexes" in c[0][0] and "fields" in c[0][0]
-            ]
-            self.assertEqual(len(field_index_calls), 2)
+        # Verify field index commands were called (2 indexes)
+        calls = self.mock_client.run_command_tolerant.call_args_list
+        field_index_count = sum(1 for c in calls if _is_field_index_call(c))
+        self.assertEqual(field_index_count, 2)
 
     def test_skip_system_default_entries(self):
         """Test that __default__ collection entries are skipped."""
@@ -192,19 +411,15 @@ class TestApplyFieldIndexes(unittest.TestCase):
             }
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            schema_dir = self._create_schema_dir(tmpdir, field_indexes)
+        schema_dir = self._create_schema_dir(field_indexes)
 
-            with patch('builtins.print'):
-                apply_schema_from_directory(self.mock_client, schema_dir)
+        with patch('builtins.print'):
+            apply_schema_from_directory(self.mock_client, schema_dir)
 
-            # Verify NO field index commands were called
-            calls = self.mock_client.run_command_tolerant.call_args_list
-            field_index_calls = [
-                c for c in calls
-                if c[0][0] and "indexes" in c[0][0] and "fields" in c[0][0]
-            ]
-            self.assertEqual(len(field_index_calls), 0)
+        # Verify NO field index commands were called
+        calls = self.mock_client.run_command_tolerant.call_args_list
+        field_index_count = sum(1 for c in calls if _is_field_index_call(c))
+        self.assertEqual(field_index_count, 0)
 
     def test_apply_mixed_formats(self):
         """Test applying mix of normalized and raw GCP formats."""
@@ -231,19 +446,15 @@ class TestApplyFieldIndexes(unittest.TestCase):
             }
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            schema_dir = self._create_schema_dir(tmpdir, field_indexes)
+        schema_dir = self._create_schema_dir(field_indexes)
 
-            with patch('builtins.print'):
-                apply_schema_from_directory(self.mock_client, schema_dir)
+        with patch('builtins.print'):
+            apply_schema_from_directory(self.mock_client, schema_dir)
 
-            # Verify 2 field index commands were called (skipping __default__)
-            calls = self.mock_client.run_command_tolerant.call_args_list
-            field_index_calls = [
-                c for c in calls
-                if c[0][0] and "indexes" in c[0][0] and "fields" in c[0][0]
-            ]
-            self.assertEqual(len(field_index_calls), 2)
+        # Verify 2 field index commands were called (skipping __default__)
+        calls = self.mock_client.run_command_tolerant.call_args_list
+        field_index_count = sum(1 for c in calls if _is_field_index_call(c))
+        self.assertEqual(field_index_count, 2)
 
     def test_apply_raw_gcp_nested_fields_format(self):
         """Test applying raw GCP format with nested fields structure."""
@@ -262,19 +473,15 @@ class TestApplyFieldIndexes(unittest.TestCase):
             }
         ]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            schema_dir = self._create_schema_dir(tmpdir, field_indexes)
+        schema_dir = self._create_schema_dir(field_indexes)
 
-            with patch('builtins.print'):
-                apply_schema_from_directory(self.mock_client, schema_dir)
+        with patch('builtins.print'):
+            apply_schema_from_directory(self.mock_client, schema_dir)
 
-            # Verify field index command was called
-            calls = self.mock_client.run_command_tolerant.call_args_list
-            field_index_calls = [
-                c for c in calls
-                if c[0][0] and "indexes" in c[0][0] and "fields" in c[0][0]
-            ]
-            self.assertEqual(len(field_index_calls), 1)
+        # Verify field index command was called
+        calls = self.mock_client.run_command_tolerant.call_args_list
+        field_index_count = sum(1 for c in calls if _is_field_index_call(c))
+        self.assertEqual(field_index_count, 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Tests for firesync.commands.env module."""
+
+import argparse
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from firesync.commands.env import cmd_list, cmd_show
+from firesync.workspace import EnvironmentConfig, WorkspaceConfig
+
+
+class TestEnvOutput(unittest.TestCase):
+    """Tests for env command output."""
+
+    def setUp(self):
+        """Set up workspace config with two environments."""
+        self.config = WorkspaceConfig(
+            version=1,
+            environments={
+                "dev": EnvironmentConfig(name="dev", key_path="keys/dev.json", description="Development"),
+                "prod": EnvironmentConfig(name="prod", key_env="PROD_KEY"),
+            },
+            schema_dir="schemas",
+            config_path=Path("/workspace/.firesync/config.yaml")
+        )
+        patcher = patch('firesync.commands.env.load_config', return_value=self.config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_list_single_write(self):
+        """Test that the environment listing is printed with one call."""
+        with patch('builtins.print') as mock_print:
+            cmd_list(argparse.Namespace())
+
+        mock_print.assert_called_once_with(
+            f"\nEnvironments in {self.config.config_path}:\n\n"
+            "  * dev\n"
+            f"    key_path: keys/dev.json - Development ({self.config.config_dir / 'keys/dev.json'})\n"
+            "  * prod\n"
+            "    key_env: PROD_KEY\n"
+        )
+
+    def test_show_single_write(self):
+        """Test that environment details are printed with one call."""
+        with patch('builtins.print') as mock_print:
+            cmd_show(argparse.Namespace(name="prod"))
+
+        mock_print.assert_called_once()
+        output = mock_print.call_args[0][0]
+        self.assertTrue(output.startswith("\nEnvironment: prod\n\n  Authentication: key_env\n"))
+        self.assertIn("  Environment variable: PROD_KEY\n", output)
+        self.assertTrue(output.endswith("\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
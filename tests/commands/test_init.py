@@ -3,55 +3,73 @@
 
 import unittest
 import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import patch
 from io import StringIO
 
+from firesync.commands.init import main as init_main
 from firesync.workspace import CONFIG_DIR_NAME, CONFIG_FILE_NAME
 
 
-class TestFirestoreInit(unittest.TestCase):
-    """Tests for firesync init command."""
-
-    def setUp(self):
-        """Create temporary directory for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.addCleanup(lambda: shutil.rmtree(self.temp_dir))
+class TestFirestoreInitDefault(unittest.TestCase):
+    """Tests for firesync init in the current directory, sharing one run."""
 
-    def test_init_success(self):
-        """Test successful workspace initialization."""
-        from firesync.commands.init import main as init_main
+    @classmethod
+    def setUpClass(cls):
+        """Initialize workspace once in a temporary cwd and capture output."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.workspace_dir = Path(cls.temp_dir.name) / CONFIG_DIR_NAME
 
-        # Mock cwd to return temp_dir
-        with patch('firesync.workspace.Path.cwd', return_value=Path(self.temp_dir)):
+        with patch('firesync.workspace.Path.cwd', return_value=Path(cls.temp_dir.name)):
             with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
                 init_main()
-                output = mock_stdout.getvalue()
+        cls.output = mock_stdout.getvalue()
 
-        # Check output
-        self.assertIn("FireSync workspace initialized", output)
-        self.assertIn("firestore-migration", output)
-        self.assertIn("Next steps:", output)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove temporary directory."""
+        cls.temp_dir.cleanup()
 
-        # Check that files were created
-        config_path = Path(self.temp_dir) / CONFIG_DIR_NAME / CONFIG_FILE_NAME
-        self.assertTrue(config_path.exists())
+    def test_output(self):
+        """Test that init reports success and next steps."""
+        for expected in ("FireSync workspace initialized", "firestore-migration", "Next steps:"):
+            with self.subTest(expected=expected):
+                self.assertIn(expected, self.output)
 
-        schemas_dir = Path(self.temp_dir) / CONFIG_DIR_NAME / "schemas"
-        self.assertTrue(schemas_dir.exists())
-        self.assertTrue(schemas_dir.is_dir())
+    def test_config_created(self):
+        """Test that config file is created."""
+        self.assertTrue((self.workspace_dir / CONFIG_FILE_NAME).exists())
+
+    def test_schemas_dir_created(self):
+        """Test that schemas directory is created."""
+        self.assertTrue((self.workspace_dir / "schemas").is_dir())
+
+
+class TestFirestoreInit(unittest.TestCase):
+    """Tests for firesync init command."""
+
+    def setUp(self):
+        """Create temporary directory and patch cwd and stdout."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+
+        # Mock cwd to return temp_dir
+        cwd_patcher = patch('firesync.workspace.Path.cwd', return_value=Path(self.temp_dir))
+        cwd_patcher.start()
+        self.addCleanup(cwd_patcher.stop)
+
+        stdout_patcher = patch('sys.stdout', new_callable=StringIO)
+        self.mock_stdout = stdout_patcher.start()
+        self.addCleanup(stdout_patcher.stop)
 
     def test_init_with_custom_path(self):
         """Test workspace initialization with custom path."""
-        from firesync.commands.init import main as init_main
-
         # Create a subdirectory path
         custom_path = Path(self.temp_dir) / "custom" / "nested"
 
-        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-            init_main(str(custom_path))
-            output = mock_stdout.getvalue()
+        init_main(str(custom_path))
+        output = self.mock_stdout.getvalue()
 
         # Check output
         self.assertIn("FireSync workspace initialized", output)
@@ -69,18 +87,14 @@ class TestFirestoreInit(unittest.TestCase):
 
     def test_init_already_exists(self):
         """Test that init fails if workspace already exists."""
-        from firesync.commands.init import main as init_main
-
         # Create workspace first
         workspace_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
         workspace_dir.mkdir()
 
         # Try to init again
-        with patch('firesync.workspace.Path.cwd', return_value=Path(self.temp_dir)):
-            with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
-                with self.assertRaises(SystemExit) as ctx:
-                    init_main()
-                output = mock_stdout.getvalue()
+        with self.assertRaises(SystemExit) as ctx:
+            init_main()
+        output = self.mock_stdout.getvalue()
 
         # Check exit code
         self.assertEqual(ctx.exception.code, 1)
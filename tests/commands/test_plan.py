@@ -0,0 +1,89 @@
+"""Unit tests for firesync.commands.plan module."""
+
+import unittest
+from unittest.mock import patch
+
+from firesync.commands.plan import (
+    format_composite_index,
+    format_field_index,
+    format_ttl,
+    print_diff,
+)
+
+
+class TestFormatFunctions(unittest.TestCase):
+    """Tests for diff item format functions."""
+
+    def test_format_composite_index(self):
+        """Test composite index formatting."""
+        item = ("users", "COLLECTION", ("age:descending", "name:ascending"))
+        self.assertEqual(
+            format_composite_index(item),
+            "users COLLECTION age:descending | name:ascending"
+        )
+
+    def test_format_field_index(self):
+        """Test field index formatting."""
+        self.assertEqual(
+            format_field_index(("users", "email", "ascending")),
+            "FIELD INDEX: (users, email) => ascending"
+        )
+
+    def test_format_ttl(self):
+        """Test TTL formatting for create/delete and update items."""
+        self.assertEqual(format_ttl(("sessions", "expireAt", "ACTIVE")), "TTL: (sessions, expireAt) => ACTIVE")
+        self.assertEqual(
+            format_ttl(("sessions", "expireAt", "ACTIVE", "INACTIVE")),
+            "TTL: (sessions, expireAt) ACTIVE -> INACTIVE"
+        )
+
+
+class TestPrintDiff(unittest.TestCase):
+    """Tests for print_diff function."""
+
+    def test_print_diff_single_write(self):
+        """Test that all changes are printed with one call in category order."""
+        diff = {
+            "create": [("users", "email")],
+            "delete": [("orders", "status")],
+            "update": [("posts", "title")]
+        }
+
+        with patch('builtins.print') as mock_print:
+            print_diff(diff, lambda item: f"{item[0]}.{item[1]}")
+
+        mock_print.assert_called_once_with(
+            "[+] WILL CREATE: users.email\n"
+            "[-] WILL DELETE: orders.status\n"
+            "[~] WILL UPDATE: posts.title"
+        )
+
+    def test_print_diff_no_changes(self):
+        """Test output when there is nothing to change."""
+        with patch('builtins.print') as mock_print:
+            print_diff({"create": set(), "delete": set()}, str)
+
+        mock_print.assert_called_once_with("[~] No changes")
+
+    def test_print_diff_quiet(self):
+        """Test that quiet mode prints only change counts."""
+        diff = {
+            "create": [("users", "email"), ("users", "name")],
+            "delete": [("orders", "status")]
+        }
+
+        with patch('builtins.print') as mock_print:
+            print_diff(diff, str, quiet=True)
+
+        mock_print.assert_called_once_with("[~] 2 to create, 1 to delete, 0 to update")
+
+    def test_print_diff_quiet_no_changes(self):
+        """Test that quiet mode reports no changes the same way."""
+        with patch('builtins.print') as mock_print:
+            print_diff({"create": set(), "delete": set(), "update": []}, str, quiet=True)
+
+        mock_print.assert_called_once_with("[~] No changes")
+
+
+if __name__ == "__main__":
+    unittest.main()
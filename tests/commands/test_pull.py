@@ -0,0 +1,125 @@
+"""Unit tests for firesync.commands.pull module."""
+
+import io
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from firesync.commands.pull import pull_environments, pull_single_environment
+from firesync.config import FiresyncConfig
+from firesync.gcloud import GCloudClient
+from firesync.schema import SchemaFile
+
+
+class TestPullSingleEnvironment(unittest.TestCase):
+    """Tests for pull_single_environment function."""
+
+    def setUp(self):
+        """Set up mocked config and client."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.config = FiresyncConfig(
+            project_id="test-project",
+            service_account="test@test-project.iam.gserviceaccount.com",
+            key_path=Path("key.json"),
+            schema_dir=Path(self.temp_dir.name) / "dev"
+        )
+        self.mock_client = MagicMock()
+
+        patcher = patch(
+            'firesync.commands.pull.setup_client',
+            return_value=(self.config, self.mock_client)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_exports_all_schema_files(self):
+        """Test that every schema file is exported."""
+        with patch('builtins.print'):
+            self.assertTrue(pull_single_environment("dev"))
+
+        exported = sorted(c[0][1] for c in self.mock_client.export_to_file.call_args_list)
+        expected = sorted(self.config.schema_dir / name for name in SchemaFile.all_files())
+        self.assertEqual(exported, expected)
+        self.assertTrue(self.config.schema_dir.is_dir())
+
+    def test_export_failure_propagates(self):
+        """Test that a failed export exits instead of being swallowed."""
+        self.mock_client.export_to_file.side_effect = SystemExit(1)
+
+        with patch('builtins.print'):
+            with self.assertRaises(SystemExit):
+                pull_single_environment("dev")
+
+
+class TestPullEnvironments(unittest.TestCase):
+    """Tests for pull_environments function."""
+
+    def test_failures_reported_in_input_order(self):
+        """Test that every environment is pulled and failures keep input order."""
+        def pull(env_name, output):
+            if env_name in ("prod", "dev"):
+                raise SystemExit(1)
+            return True
+
+        with patch('firesync.commands.pull.pull_single_environment', side_effect=pull) as mock_pull:
+            with patch('builtins.print'):
+                failed = pull_environments(["dev", "staging", "prod"], parallel=3)
+
+        self.assertEqual(failed, ["dev", "prod"])
+        self.assertEqual(sorted(c[0][0] for c in mock_pull.call_args_list), ["dev", "prod", "staging"])
+
+    def test_all_succeed(self):
+        """Test that no failures are returned when every pull succeeds."""
+        with patch('firesync.commands.pull.pull_single_environment', return_value=True):
+            with patch('builtins.print'):
+                self.assertEqual(pull_environments(["dev", "prod"], parallel=1), [])
+
+    def test_output_grouped_per_environment(self):
+        """Test that concurrent pulls print each environment's output in one block."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        def setup_client(env, output):
+            config = FiresyncConfig(
+                project_id=f"{env}-project",
+                service_account=f"sa@{env}-project.iam.gserviceaccount.com",
+                key_path=Path("key.json"),
+                schema_dir=Path(temp_dir.name) / env
+            )
+            return config, GCloudClient(config, output)
+
+        # Both environments export in lockstep, so unbuffered output would interleave
+        barrier = threading.Barrier(2)
+
+        def run(*args, **kwargs):
+            barrier.wait(timeout=5)
+            return MagicMock(returncode=0)
+
+        stdout = io.StringIO()
+        with patch('firesync.commands.pull.setup_client', side_effect=setup_client), \
+                patch('firesync.gcloud.subprocess.run', side_effect=run):
+            with redirect_stdout(stdout):
+                self.assertEqual(pull_environments(["dev", "prod"], parallel=2), [])
+
+        lines = stdout.getvalue().splitlines()
+        for env_name in ("dev", "prod"):
+            start = next(i for i, line in enumerate(lines) if line.endswith(f"Pulling environment: {env_name}"))
+            end = lines.index(f"[+] Pulled environment: {env_name}")
+            block = lines[start + 2:end]
+            self.assertEqual(block, [
+                "",
+                f"[~] Using sa@{env_name}-project.iam.gserviceaccount.com for project {env_name}-project",
+                f"[+] Exporting {SchemaFile.COMPOSITE_INDEXES}",
+                f"[+] Exporting {SchemaFile.FIELD_INDEXES}",
+                f"[+] Exporting {SchemaFile.TTL_POLICIES}",
+                f"[+] Firestore schema exported to: {Path(temp_dir.name) / env_name}",
+            ])
+
+
+if __name__ == "__main__":
+    unittest.main()
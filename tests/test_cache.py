@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Tests for firesync.cache module."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from firesync.cache import FileCache, file_signature
+
+
+class TestFileSignature(unittest.TestCase):
+    """Tests for file_signature function."""
+
+    def setUp(self):
+        """Create temporary file for testing."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = Path(self.temp_dir.name) / "data.txt"
+        self.path.write_text("one")
+
+    def test_signature_stable(self):
+        """Test that signature does not change for untouched file."""
+        self.assertEqual(file_signature(self.path), file_signature(self.path))
+
+    def test_signature_changes_on_replace(self):
+        """Test that atomic replacement changes the signature."""
+        before = file_signature(self.path)
+
+        tmp_path = Path(self.temp_dir.name) / "data.tmp"
+        tmp_path.write_text("two")
+        os.replace(tmp_path, self.path)
+
+        self.assertNotEqual(file_signature(self.path), before)
+
+    def test_signature_missing_file(self):
+        """Test that missing file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            file_signature(Path(self.temp_dir.name) / "missing.txt")
+
+
+class TestFileCache(unittest.TestCase):
+    """Tests for FileCache class."""
+
+    def setUp(self):
+        """Create temporary file and cache for testing."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.path = Path(self.temp_dir.name) / "data.txt"
+        self.path.write_text("one")
+
+        self.cache = FileCache()
+        self.parse_calls = []
+
+    def parse(self, path):
+        """Parser stub that records calls."""
+        self.parse_calls.append(path)
+        return path.read_text()
+
+    def test_get_parses_once(self):
+        """Test that unchanged file is parsed only once."""
+        self.assertEqual(self.cache.get(self.path, self.parse), "one")
+        self.assertEqual(self.cache.get(self.path, self.parse), "one")
+        self.assertEqual(len(self.parse_calls), 1)
+
+    def test_get_reparses_changed_file(self):
+        """Test that modified file is parsed again."""
+        self.cache.get(self.path, self.parse)
+        self.path.write_text("changed")
+
+        self.assertEqual(self.cache.get(self.path, self.parse), "changed")
+        self.assertEqual(len(self.parse_calls), 2)
+
+    def test_invalidate(self):
+        """Test that invalidated entry is parsed again."""
+        self.cache.get(self.path, self.parse)
+        self.cache.invalidate(self.path)
+        self.cache.get(self.path, self.parse)
+        self.assertEqual(len(self.parse_calls), 2)
+
+    def test_clear(self):
+        """Test that clear drops all entries."""
+        self.cache.get(self.path, self.parse)
+        self.cache.clear()
+        self.cache.get(self.path, self.parse)
+        self.assertEqual(len(self.parse_calls), 2)
+
+    def test_get_missing_file(self):
+        """Test that missing file raises FileNotFoundError without parsing."""
+        with self.assertRaises(FileNotFoundError):
+            self.cache.get(Path(self.temp_dir.name) / "missing.txt", self.parse)
+        self.assertEqual(self.parse_calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,118 +1,196 @@
 """Unit tests for firesync.cli module."""
 
+import argparse
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
-
-from firesync.cli import parse_pull_args, parse_plan_args, parse_apply_args, setup_client
+from unittest.mock import DEFAULT, MagicMock, patch
+
+from firesync.cli import (
+    _build_parser,
+    _validate_migration_args,
+    parse_apply_args,
+    parse_plan_args,
+    parse_pull_args,
+    setup_client,
+)
 from firesync.config import FiresyncConfig
-from firesync.workspace import WorkspaceConfig, EnvironmentConfig
+from firesync.workspace import CONFIG_FILE_NAME, EnvironmentConfig, WorkspaceConfig
+
+
+def _make_workspace_config(env_config, config_dir):
+    """Build a workspace config holding env_config with schemas under firestore_schema/."""
+    return WorkspaceConfig(
+        version=1,
+        environments={env_config.name: env_config},
+        schema_dir='firestore_schema',
+        config_path=Path(config_dir) / CONFIG_FILE_NAME
+    )
 
 
 class TestParsePullArgs(unittest.TestCase):
     """Tests for parse_pull_args function."""
 
-    def test_parse_pull_all(self):
-        """Test parsing --all flag."""
+    def test_valid_arguments(self):
+        """Test parsed values for accepted argument combinations."""
+        cases = [
+            (['--all'], {'all': True, 'env': None}),
+            (['--env', 'dev'], {'all': False, 'env': 'dev'}),
+            (['--all', '--parallel', '2'], {'all': True, 'parallel': 2}),
+        ]
+        for argv, expected in cases:
+            with self.subTest(argv=argv):
+                args = parse_pull_args("Test description", argv)
+                for attr, value in expected.items():
+                    self.assertEqual(getattr(args, attr), value)
+
+    def test_invalid_arguments(self):
+        """Test that rejected argument combinations exit."""
+        cases = [
+            [],
+            ['--all', '--parallel', '0'],
+        ]
+        for argv in cases:
+            with self.subTest(argv=argv):
+                with patch('sys.stderr'), self.assertRaises(SystemExit):
+                    parse_pull_args("Test description", argv)
+
+    def test_parse_pull_explicit_argv(self):
+        """Test parsing an explicit argument list instead of sys.argv."""
         with patch.object(sys, 'argv', ['prog', '--all']):
-            args = parse_pull_args("Test description")
-            self.assertTrue(args.all)
-            self.assertIsNone(args.env)
-
-    def test_parse_pull_env(self):
-        """Test parsing --env argument."""
-        with patch.object(sys, 'argv', ['prog', '--env', 'dev']):
-            args = parse_pull_args("Test description")
-            self.assertFalse(args.all)
+            args = parse_pull_args("Test description", ['--env', 'dev'])
             self.assertEqual(args.env, 'dev')
+            self.assertFalse(args.all)
 
-    def test_parse_pull_missing_required(self):
-        """Test that error is raised when no required arguments."""
-        with patch.object(sys, 'argv', ['prog']):
-            with self.assertRaises(SystemExit):
-                parse_pull_args("Test description")
+    def test_parse_pull_parallel_default(self):
+        """Test that --parallel defaults to at least one environment."""
+        args = parse_pull_args("Test description", ['--all'])
+        self.assertTrue(1 <= args.parallel <= 4)
 
 
 class TestParsePlanArgs(unittest.TestCase):
     """Tests for parse_plan_args function."""
 
-    def test_parse_plan_env(self):
-        """Test parsing --env argument."""
-        with patch.object(sys, 'argv', ['prog', '--env', 'dev']):
-            args = parse_plan_args("Test description")
-            self.assertEqual(args.env, 'dev')
-            self.assertIsNone(args.env_from)
-            self.assertIsNone(args.env_to)
-
-    def test_parse_plan_migration(self):
-        """Test parsing migration mode arguments."""
-        with patch.object(sys, 'argv', ['prog', '--env-from', 'dev', '--env-to', 'staging']):
-            args = parse_plan_args("Test description")
-            self.assertEqual(args.env_from, 'dev')
-            self.assertEqual(args.env_to, 'staging')
-            self.assertIsNone(args.env)
-
-    def test_parse_plan_with_schema_dir(self):
-        """Test parsing with schema directory override."""
-        with patch.object(sys, 'argv', ['prog', '--env', 'dev', '--schema-dir', 'custom']):
-            args = parse_plan_args("Test description")
-            self.assertEqual(args.env, 'dev')
-            self.assertEqual(args.schema_dir, 'custom')
-
-    def test_parse_plan_migration_with_env_error(self):
-        """Test that migration mode and env are mutually exclusive."""
-        with patch.object(sys, 'argv', ['prog', '--env-from', 'dev', '--env-to', 'staging', '--env', 'prod']):
-            with self.assertRaises(SystemExit):
-                parse_plan_args("Test description")
-
-    def test_parse_plan_incomplete_migration_error(self):
-        """Test that both env-from and env-to must be specified."""
-        with patch.object(sys, 'argv', ['prog', '--env-from', 'dev']):
-            with self.assertRaises(SystemExit):
-                parse_plan_args("Test description")
-
-    def test_parse_plan_missing_arguments_error(self):
-        """Test that at least one mode must be specified."""
-        with patch.object(sys, 'argv', ['prog']):
-            with self.assertRaises(SystemExit):
-                parse_plan_args("Test description")
+    def test_valid_arguments(self):
+        """Test parsed values for accepted argument combinations."""
+        cases = [
+            (['--env', 'dev'], {'env': 'dev', 'env_from': None, 'env_to': None}),
+            (['--env-from', 'dev', '--env-to', 'staging'], {'env': None, 'env_from': 'dev', 'env_to': 'staging'}),
+            (['--env', 'dev', '--schema-dir', 'custom'], {'env': 'dev', 'schema_dir': 'custom', 'quiet': False}),
+            (['--env', 'dev', '--quiet'], {'quiet': True}),
+        ]
+        for argv, expected in cases:
+            with self.subTest(argv=argv):
+                args = parse_plan_args("Test description", argv)
+                for attr, value in expected.items():
+                    self.assertEqual(getattr(args, attr), value)
+
+    def test_invalid_arguments(self):
+        """Test that mixed, incomplete or missing modes exit."""
+        cases = [
+            ['--env-from', 'dev', '--env-to', 'staging', '--env', 'prod'],
+            ['--env-from', 'dev'],
+            [],
+        ]
+        for argv in cases:
+            with self.subTest(argv=argv):
+                with patch('sys.stderr'), self.assertRaises(SystemExit):
+                    parse_plan_args("Test description", argv)
+
+
+class TestValidateMigrationArgs(unittest.TestCase):
+    """Tests for _validate_migration_args function."""
+
+    def test_error_messages(self):
+        """Test error reported for every combination of arguments."""
+        incomplete = "Both --env-from and --env-to must be specified for migration mode"
+        cases = [
+            ((None, None, None), "Must specify either (--env-from and --env-to) or --env"),
+            ((None, None, 'dev'), None),
+            ((None, 'prod', None), incomplete),
+            ((None, 'prod', 'dev'), incomplete),
+            (('dev', None, None), incomplete),
+            (('dev', None, 'dev'), incomplete),
+            (('dev', 'prod', None), None),
+            (('dev', 'prod', 'dev'), "Cannot use --env-from/--env-to with --env"),
+        ]
+        for (env_from, env_to, env), expected in cases:
+            with self.subTest(env_from=env_from, env_to=env_to, env=env):
+                parser = MagicMock()
+                args = argparse.Namespace(env_from=env_from, env_to=env_to, env=env)
+
+                _validate_migration_args(parser, args)
+
+                if expected is None:
+                    parser.error.assert_not_called()
+                else:
+                    parser.error.assert_called_once_with(expected)
+
+
+class TestBuildParser(unittest.TestCase):
+    """Tests for _build_parser function."""
+
+    def test_parser_reused(self):
+        """Test that parser is built once per command and description."""
+        self.assertIs(_build_parser("plan", "Test description"), _build_parser("plan", "Test description"))
+        self.assertIsNot(_build_parser("plan", "Test description"), _build_parser("apply", "Test description"))
+
+    def test_reused_parser_returns_fresh_namespace(self):
+        """Test that repeated parsing does not leak values between calls."""
+        parse_apply_args("Test description", ['--env', 'dev', '--schema-dir', 'custom'])
+        args = parse_apply_args("Test description", ['--env', 'prod'])
+
+        self.assertEqual(args.env, 'prod')
+        self.assertIsNone(args.schema_dir)
+
+    def test_unknown_kind(self):
+        """Test that unknown command kind raises ValueError."""
+        with self.assertRaises(ValueError):
+            _build_parser("unknown", "Test description")
 
 
 class TestParseApplyArgs(unittest.TestCase):
     """Tests for parse_apply_args function."""
 
-    def test_parse_apply_env(self):
-        """Test parsing --env argument."""
-        with patch.object(sys, 'argv', ['prog', '--env', 'dev']):
-            args = parse_apply_args("Test description")
-            self.assertEqual(args.env, 'dev')
-            self.assertIsNone(args.env_from)
-            self.assertIsNone(args.env_to)
-
-    def test_parse_apply_migration(self):
-        """Test parsing migration mode arguments."""
-        with patch.object(sys, 'argv', ['prog', '--env-from', 'dev', '--env-to', 'prod']):
-            args = parse_apply_args("Test description")
-            self.assertEqual(args.env_from, 'dev')
-            self.assertEqual(args.env_to, 'prod')
-            self.assertIsNone(args.env)
-
-    def test_parse_apply_with_schema_dir(self):
-        """Test parsing with schema directory override."""
-        with patch.object(sys, 'argv', ['prog', '--env', 'staging', '--schema-dir', '/custom/path']):
-            args = parse_apply_args("Test description")
-            self.assertEqual(args.env, 'staging')
-            self.assertEqual(args.schema_dir, '/custom/path')
+    def test_valid_arguments(self):
+        """Test parsed values for accepted argument combinations."""
+        cases = [
+            (['--env', 'dev'], {'env': 'dev', 'env_from': None, 'env_to': None, 'max_parallel': 1, 'no_wait': False}),
+            (['--env-from', 'dev', '--env-to', 'prod'], {'env': None, 'env_from': 'dev', 'env_to': 'prod'}),
+            (['--env', 'staging', '--schema-dir', '/custom/path'], {'env': 'staging', 'schema_dir': '/custom/path'}),
+            (['--env', 'dev', '--max-parallel', '2'], {'max_parallel': 2}),
+            (['--env', 'dev', '--async'], {'no_wait': True}),
+        ]
+        for argv, expected in cases:
+            with self.subTest(argv=argv):
+                args = parse_apply_args("Test description", argv)
+                for attr, value in expected.items():
+                    self.assertEqual(getattr(args, attr), value)
+
+    def test_parse_apply_invalid_max_parallel(self):
+        """Test that --max-parallel below 1 fails."""
+        with patch('sys.stderr'), self.assertRaises(SystemExit):
+            parse_apply_args("Test description", ['--env', 'dev', '--max-parallel', '0'])
 
 
 class TestSetupClient(unittest.TestCase):
     """Tests for setup_client function."""
 
-    @patch('firesync.cli.GCloudClient')
-    @patch('firesync.cli.load_config')
-    @patch('firesync.config.FiresyncConfig.from_args')
-    def test_setup_client_with_key_path(self, mock_from_args, mock_load_config, mock_gcloud):
+    def setUp(self):
+        """Patch workspace loading, config creation and gcloud client."""
+        cli_patcher = patch.multiple('firesync.cli', GCloudClient=DEFAULT, load_config=DEFAULT)
+        cli_mocks = cli_patcher.start()
+        self.addCleanup(cli_patcher.stop)
+        self.mock_gcloud = cli_mocks['GCloudClient']
+        self.mock_load_config = cli_mocks['load_config']
+
+        from_args_patcher = patch('firesync.config.FiresyncConfig.from_args')
+        self.mock_from_args = from_args_patcher.start()
+        self.addCleanup(from_args_patcher.stop)
+        self.mock_config = MagicMock(spec=FiresyncConfig)
+        self.mock_from_args.return_value = self.mock_config
+
+    def test_setup_client_with_key_path(self):
         """Test setup_client with key_path configuration."""
         # Setup mock workspace config
         env_config = EnvironmentConfig(
@@ -121,36 +199,24 @@ class TestSetupClient(unittest.TestCase):
             key_env=None,
             description=None
         )
-        workspace_config = MagicMock(spec=WorkspaceConfig)
-        workspace_config.get_env.return_value = env_config
-        workspace_config.config_dir = Path('/test')
-        workspace_config.get_schema_dir.return_value = Path('/test/firestore_schema/dev')
-        mock_load_config.return_value = workspace_config
-
-        # Setup mock config
-        mock_config = MagicMock(spec=FiresyncConfig)
-        mock_from_args.return_value = mock_config
+        self.mock_load_config.return_value = _make_workspace_config(env_config, '/test')
 
         # Call setup_client
         config, client = setup_client('dev')
 
         # Verify
-        mock_load_config.assert_called_once()
-        workspace_config.get_env.assert_called_once_with('dev')
+        self.mock_load_config.assert_called_once()
 
         # Check call arguments (convert paths to strings for cross-platform compatibility)
-        call_args = mock_from_args.call_args[1]
+        call_args = self.mock_from_args.call_args[1]
         self.assertEqual(call_args['key_path'], str(Path('/test/secrets/key.json')))
         self.assertIsNone(call_args['key_env'])
         self.assertEqual(call_args['schema_dir'], str(Path('/test/firestore_schema/dev')))
 
-        mock_config.display_info.assert_called_once()
-        mock_gcloud.assert_called_once_with(mock_config)
+        self.mock_config.display_info.assert_called_once()
+        self.mock_gcloud.assert_called_once_with(self.mock_config, None)
 
-    @patch('firesync.cli.GCloudClient')
-    @patch('firesync.cli.load_config')
-    @patch('firesync.config.FiresyncConfig.from_args')
-    def test_setup_client_with_key_env(self, mock_from_args, mock_load_config, mock_gcloud):
+    def test_setup_client_with_key_env(self):
         """Test setup_client with key_env configuration."""
         # Setup mock workspace config
         env_config = EnvironmentConfig(
@@ -159,29 +225,18 @@ class TestSetupClient(unittest.TestCase):
             key_env='GCP_KEY',
             description=None
         )
-        workspace_config = MagicMock(spec=WorkspaceConfig)
-        workspace_config.get_env.return_value = env_config
-        workspace_config.config_dir = Path('/project')
-        workspace_config.get_schema_dir.return_value = Path('/project/firestore_schema/staging')
-        mock_load_config.return_value = workspace_config
-
-        # Setup mock config
-        mock_config = MagicMock(spec=FiresyncConfig)
-        mock_from_args.return_value = mock_config
+        self.mock_load_config.return_value = _make_workspace_config(env_config, '/project')
 
         # Call setup_client
         config, client = setup_client('staging')
 
         # Verify (convert paths to strings for cross-platform compatibility)
-        call_args = mock_from_args.call_args[1]
+        call_args = self.mock_from_args.call_args[1]
         self.assertIsNone(call_args['key_path'])
         self.assertEqual(call_args['key_env'], 'GCP_KEY')
         self.assertEqual(call_args['schema_dir'], str(Path('/project/firestore_schema/staging')))
 
-    @patch('firesync.cli.GCloudClient')
-    @patch('firesync.cli.load_config')
-    @patch('firesync.config.FiresyncConfig.from_args')
-    def test_setup_client_with_schema_dir_override(self, mock_from_args, mock_load_config, mock_gcloud):
+    def test_setup_client_with_schema_dir_override(self):
         """Test setup_client with schema_dir override."""
         # Setup mock workspace config
         env_config = EnvironmentConfig(
@@ -190,23 +245,17 @@ class TestSetupClient(unittest.TestCase):
             key_env='GCP_KEY',
             description=None
         )
-        workspace_config = MagicMock(spec=WorkspaceConfig)
-        workspace_config.get_env.return_value = env_config
-        workspace_config.config_dir = Path('/test')
-        mock_load_config.return_value = workspace_config
-
-        # Setup mock config
-        mock_config = MagicMock(spec=FiresyncConfig)
-        mock_from_args.return_value = mock_config
+        self.mock_load_config.return_value = _make_workspace_config(env_config, '/test')
 
         # Call setup_client with schema_dir override
         config, client = setup_client('dev', schema_dir='/custom/schemas')
 
         # Verify schema_dir override is used
-        mock_from_args.assert_called_once_with(
+        self.mock_from_args.assert_called_once_with(
             key_path=None,
             key_env='GCP_KEY',
-            schema_dir='/custom/schemas'
+            schema_dir='/custom/schemas',
+            output=None
         )
 
 
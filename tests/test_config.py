@@ -1,31 +1,38 @@
 #!/usr/bin/env python3
 """Tests for firesync.config module."""
 
+import gc
+import io
 import json
 import os
 import tempfile
 import unittest
+from contextlib import redirect_stdout
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import patch
 
-from firesync.config import FiresyncConfig
+from firesync.config import FiresyncConfig, _parse_key_file
+from firesync.schema import SchemaFile
+
+# Service account key shared by tests that only need a valid key
+TEST_KEY_DATA = {
+    "type": "service_account",
+    "project_id": "test-project",
+    "client_email": "test@test-project.iam.gserviceaccount.com"
+}
+TEST_KEY_JSON = json.dumps(TEST_KEY_DATA)
+
+# Key missing the client_email field
+PARTIAL_KEY_JSON = '{"project_id": "test-project"}'
 
 
 class TestLoadKeyAutoDetect(unittest.TestCase):
     """Tests for _load_key auto-detection of JSON content vs file path."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_key_data = {
-            "type": "service_account",
-            "project_id": "test-project",
-            "client_email": "test@test-project.iam.gserviceaccount.com"
-        }
-        self.test_key_json = json.dumps(self.test_key_data)
-
     def test_key_env_with_json_content(self):
         """Test that key_env with JSON content creates temp file."""
-        with patch.dict(os.environ, {'GCP_KEY': self.test_key_json}):
+        with patch.dict(os.environ, {'GCP_KEY': TEST_KEY_JSON}):
             key_data, key_path, temp_file = FiresyncConfig._load_key(
                 key_path=None,
                 key_env='GCP_KEY'
@@ -34,16 +41,29 @@ class TestLoadKeyAutoDetect(unittest.TestCase):
             self.assertEqual(key_data['project_id'], 'test-project')
             self.assertIsNotNone(temp_file)  # Temp file created for JSON content
             self.assertTrue(key_path.exists())
+            self.assertEqual(key_path.read_text(encoding='utf-8'), TEST_KEY_JSON)
 
             # Clean up temp file
             if temp_file:
                 os.unlink(temp_file)
 
+    def test_key_env_temp_file_location(self):
+        """Test that temp key file is created in the temp key directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('firesync.config._TEMP_KEY_DIR', tmpdir):
+                with patch.dict(os.environ, {'GCP_KEY': TEST_KEY_JSON}):
+                    _, key_path, _ = FiresyncConfig._load_key(key_path=None, key_env='GCP_KEY')
+
+            self.assertEqual(key_path.parent, Path(tmpdir))
+            # Windows only reports read-only/read-write permission bits
+            if os.name == "posix":
+                self.assertEqual(os.stat(key_path).st_mode & 0o777, 0o600)
+
     def test_key_env_with_file_path(self):
         """Test that key_env with file path reads from that file."""
         # Create temp key file
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(self.test_key_data, f)
+            f.write(TEST_KEY_JSON)
             temp_key_path = f.name
 
         try:
@@ -59,32 +79,28 @@ class TestLoadKeyAutoDetect(unittest.TestCase):
         finally:
             os.unlink(temp_key_path)
 
-    def test_key_env_not_set(self):
-        """Test that missing env var causes exit."""
-        with patch.dict(os.environ, {}, clear=True):
-            # Remove the key if it exists
-            os.environ.pop('NONEXISTENT_KEY', None)
+    def test_key_env_path_skips_json_parse(self):
+        """Test that a value that cannot be a JSON object is not parsed as JSON."""
+        with patch.dict(os.environ, {'GCP_KEY': '/nonexistent/path/to/key.json'}):
+            with patch('firesync.config.jsonio.loads') as mock_parse:
+                with patch('builtins.print'), self.assertRaises(SystemExit):
+                    FiresyncConfig._load_key(key_path=None, key_env='GCP_KEY')
 
-            with self.assertRaises(SystemExit):
-                FiresyncConfig._load_key(
-                    key_path=None,
-                    key_env='NONEXISTENT_KEY'
-                )
+        mock_parse.assert_not_called()
 
-    def test_key_env_invalid_path(self):
-        """Test that invalid file path in env var causes exit."""
-        with patch.dict(os.environ, {'GCP_KEY': '/nonexistent/path/to/key.json'}):
-            with self.assertRaises(SystemExit):
-                FiresyncConfig._load_key(
-                    key_path=None,
-                    key_env='GCP_KEY'
-                )
+    def test_key_env_with_indented_json_content(self):
+        """Test that JSON content with leading whitespace is detected."""
+        with patch.dict(os.environ, {'GCP_KEY': '\n  ' + TEST_KEY_JSON}):
+            key_data, _, temp_file = FiresyncConfig._load_key(key_path=None, key_env='GCP_KEY')
+        self.addCleanup(os.unlink, temp_file)
+
+        self.assertEqual(key_data['project_id'], 'test-project')
 
     def test_key_path_direct(self):
         """Test direct key_path works as before."""
         # Create temp key file
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(self.test_key_data, f)
+            f.write(TEST_KEY_JSON)
             temp_key_path = f.name
 
         try:
@@ -98,21 +114,224 @@ class TestLoadKeyAutoDetect(unittest.TestCase):
         finally:
             os.unlink(temp_key_path)
 
-    def test_both_key_path_and_key_env_fails(self):
-        """Test that specifying both key_path and key_env causes exit."""
-        with self.assertRaises(SystemExit):
-            FiresyncConfig._load_key(
-                key_path='/some/path',
-                key_env='SOME_KEY'
-            )
 
-    def test_neither_key_path_nor_key_env_fails(self):
-        """Test that specifying neither key_path nor key_env causes exit."""
-        with self.assertRaises(SystemExit):
-            FiresyncConfig._load_key(
-                key_path=None,
-                key_env=None
-            )
+class TestFromArgsErrors(unittest.TestCase):
+    """Tests for key sources rejected by from_args."""
+
+    def setUp(self):
+        """Create invalid key files."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = Path(temp_dir.name)
+
+        (self.temp_dir / "invalid.json").write_text("not json")
+        (self.temp_dir / "partial.json").write_text(PARTIAL_KEY_JSON)
+
+    def test_invalid_key_sources(self):
+        """Test that every invalid key source exits with status 1."""
+        cases = [
+            ("neither key_path nor key_env", {}),
+            ("both key_path and key_env", {'key_path': '/some/path', 'key_env': 'GCP_KEY'}),
+            ("key_env not set", {'key_env': 'NONEXISTENT_KEY'}),
+            ("key_env invalid path", {'key_env': 'GCP_KEY'}),
+            ("key file missing", {'key_path': str(self.temp_dir / "missing.json")}),
+            ("key file invalid JSON", {'key_path': str(self.temp_dir / "invalid.json")}),
+            ("key file missing fields", {'key_path': str(self.temp_dir / "partial.json")}),
+        ]
+        env = {'GCP_KEY': '/nonexistent/path/to/key.json'}
+        for name, kwargs in cases:
+            with self.subTest(name):
+                with patch.dict(os.environ, env, clear=True), patch('builtins.print'):
+                    with self.assertRaises(SystemExit) as ctx:
+                        FiresyncConfig.from_args(**kwargs)
+                self.assertEqual(ctx.exception.code, 1)
+
+
+class TestKeyCache(unittest.TestCase):
+    """Tests for caching of parsed key data."""
+
+    def setUp(self):
+        """Create temporary key file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.key_path = Path(self.temp_dir.name) / "key.json"
+        self.key_path.write_text(TEST_KEY_JSON)
+
+    def test_key_file_parsed_once(self):
+        """Test that unchanged key file is parsed only once."""
+        with patch('firesync.config._parse_key_file', wraps=_parse_key_file) as mock_parse:
+            FiresyncConfig._load_key(key_path=str(self.key_path), key_env=None)
+            key_data, _, _ = FiresyncConfig._load_key(key_path=str(self.key_path), key_env=None)
+
+        self.assertEqual(mock_parse.call_count, 1)
+        self.assertEqual(key_data['project_id'], 'test-project')
+
+    def test_key_file_change_is_picked_up(self):
+        """Test that rewritten key file is parsed again."""
+        FiresyncConfig._load_key(key_path=str(self.key_path), key_env=None)
+        self.key_path.write_text(json.dumps({
+            "project_id": "other-project",
+            "client_email": "test@other-project.iam.gserviceaccount.com"
+        }))
+
+        key_data, _, _ = FiresyncConfig._load_key(key_path=str(self.key_path), key_env=None)
+        self.assertEqual(key_data['project_id'], 'other-project')
+
+    def test_cached_key_data_is_copied(self):
+        """Test that mutating returned key data does not affect the cache."""
+        key_data, _, _ = FiresyncConfig._load_key(key_path=str(self.key_path), key_env=None)
+        key_data['project_id'] = 'mutated'
+
+        key_data, _, _ = FiresyncConfig._load_key(key_path=str(self.key_path), key_env=None)
+        self.assertEqual(key_data['project_id'], 'test-project')
+
+
+class TestTempKeyCleanup(unittest.TestCase):
+    """Tests for temporary key file cleanup."""
+
+    def _make_config(self, temp_file):
+        """Create config owning the given temp key file."""
+        return FiresyncConfig(
+            project_id="test-project",
+            service_account="test@test-project.iam.gserviceaccount.com",
+            key_path=Path(temp_file),
+            schema_dir=Path("firestore_schema"),
+            _temp_key_file=temp_file
+        )
+
+    def test_temp_file_removed_with_config(self):
+        """Test that temp key file is removed when config is collected."""
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".json")
+        os.close(temp_fd)
+
+        config = self._make_config(temp_path)
+        self.assertTrue(os.path.exists(temp_path))
+
+        del config
+        gc.collect()
+        self.assertFalse(os.path.exists(temp_path))
+
+    def test_missing_temp_file_ignored(self):
+        """Test that already removed temp key file does not raise."""
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".json")
+        os.close(temp_fd)
+
+        config = self._make_config(temp_path)
+        os.unlink(temp_path)
+
+        del config
+        gc.collect()
+        self.assertFalse(os.path.exists(temp_path))
+
+    def test_temp_file_removed_on_exit(self):
+        """Test that temp key file is removed when leaving the context."""
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".json")
+        os.close(temp_fd)
+
+        with self._make_config(temp_path) as config:
+            self.assertTrue(os.path.exists(temp_path))
+        self.assertFalse(os.path.exists(temp_path))
+
+        # Closing again is a no-op
+        config.close()
+
+    def test_close_without_temp_file(self):
+        """Test that closing config without temp key file does nothing."""
+        config = FiresyncConfig(
+            project_id="test-project",
+            service_account="test@test-project.iam.gserviceaccount.com",
+            key_path=Path("key.json"),
+            schema_dir=Path("firestore_schema")
+        )
+        config.close()
+
+    def test_config_is_frozen(self):
+        """Test that config fields cannot be reassigned."""
+        config = FiresyncConfig(
+            project_id="test-project",
+            service_account="test@test-project.iam.gserviceaccount.com",
+            key_path=Path("key.json"),
+            schema_dir=Path("firestore_schema")
+        )
+        with self.assertRaises(FrozenInstanceError):
+            config.project_id = "other-project"
+
+
+class TestSchemaPaths(unittest.TestCase):
+    """Tests for cached schema file paths."""
+
+    def setUp(self):
+        """Create config with a fixed schema directory."""
+        self.config = FiresyncConfig(
+            project_id="test-project",
+            service_account="test@test-project.iam.gserviceaccount.com",
+            key_path=Path("key.json"),
+            schema_dir=Path("firestore_schema")
+        )
+
+    def test_schema_paths(self):
+        """Test that schema file paths are joined onto schema_dir."""
+        self.assertEqual(self.config.composite_path, Path("firestore_schema") / SchemaFile.COMPOSITE_INDEXES)
+        self.assertEqual(self.config.field_path, Path("firestore_schema") / SchemaFile.FIELD_INDEXES)
+        self.assertEqual(self.config.ttl_path, Path("firestore_schema") / SchemaFile.TTL_POLICIES)
+
+    def test_schema_paths_cached(self):
+        """Test that schema file paths are computed once per config."""
+        self.assertIs(self.config.composite_path, self.config.composite_path)
+
+
+class TestDisplayInfo(unittest.TestCase):
+    """Tests for display_info method."""
+
+    def test_display_info(self):
+        """Test that project, service account and key path are printed."""
+        config = FiresyncConfig(
+            project_id="test-project",
+            service_account="test@test-project.iam.gserviceaccount.com",
+            key_path=Path("key.json"),
+            schema_dir=Path("firestore_schema")
+        )
+
+        with redirect_stdout(io.StringIO()) as stdout:
+            config.display_info()
+
+        self.assertEqual(
+            stdout.getvalue().splitlines(),
+            [
+                "[~] Project: test-project",
+                "[~] Service Account: test@test-project.iam.gserviceaccount.com",
+                f"[~] Key Path: {Path('key.json')}",
+            ]
+        )
+
+
+class TestResolveSchemaDir(unittest.TestCase):
+    """Tests for schema directory resolution."""
+
+    def test_schema_dir_follows_cwd(self):
+        """Test that relative schema_dir is resolved against the current directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            key_path = Path(tmpdir) / "key.json"
+            key_path.write_text(TEST_KEY_JSON)
+
+            for name in ("a", "b"):
+                workdir = Path(tmpdir) / name
+                workdir.mkdir()
+                with patch('firesync.config.os.getcwd', return_value=str(workdir)), patch('builtins.print'):
+                    config = FiresyncConfig.from_args(key_path=str(key_path), schema_dir="schema")
+                self.assertEqual(config.schema_dir, workdir.resolve() / "schema")
+
+    def test_absolute_schema_dir_skips_cwd(self):
+        """Test that absolute schema_dir is resolved without looking up the current directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            key_path = Path(tmpdir) / "key.json"
+            key_path.write_text(TEST_KEY_JSON)
+
+            with patch('firesync.config.os.getcwd') as mock_getcwd, patch('builtins.print'):
+                config = FiresyncConfig.from_args(key_path=str(key_path), schema_dir=tmpdir)
+
+            mock_getcwd.assert_not_called()
+            self.assertEqual(config.schema_dir, Path(tmpdir).resolve())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,153 @@
+"""Unit tests for firesync.gcloud module."""
+
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from firesync.config import FiresyncConfig
+from firesync.gcloud import GCloudClient
+
+
+class TestGCloudClient(unittest.TestCase):
+    """Tests for GCloudClient class."""
+
+    def setUp(self):
+        """Set up client with authentication already done."""
+        self.config = FiresyncConfig(
+            project_id="test-project",
+            service_account="test@test-project.iam.gserviceaccount.com",
+            key_path=Path("key.json"),
+            schema_dir=Path("firestore_schema")
+        )
+        self.client = GCloudClient(self.config)
+        self.client._authenticated = True
+
+        patcher = patch("firesync.gcloud.subprocess.run")
+        self.mock_run = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        print_patcher = patch("builtins.print")
+        self.mock_print = print_patcher.start()
+        self.addCleanup(print_patcher.stop)
+
+    def test_credentials_passed_via_environment(self):
+        """Test that gcloud gets the key file through the environment."""
+        self.mock_run.return_value = MagicMock(returncode=0, stderr="")
+
+        self.client.run_command_tolerant(["firestore", "indexes"])
+
+        env = self.mock_run.call_args[1]["env"]
+        self.assertEqual(env["CLOUDSDK_AUTH_CREDENTIAL_FILE_OVERRIDE"], "key.json")
+
+    def test_activate_does_not_spawn(self):
+        """Test that activation does not run gcloud auth."""
+        client = GCloudClient(self.config)
+        client.activate_service_account()
+        client.activate_service_account()
+
+        self.mock_run.assert_not_called()
+
+    def test_run_command_tolerant_discards_stdout(self):
+        """Test that tolerant commands only pipe stderr."""
+        self.mock_run.return_value = MagicMock(returncode=0, stderr="")
+
+        self.assertTrue(self.client.run_command_tolerant(["firestore", "indexes"]))
+
+        kwargs = self.mock_run.call_args[1]
+        self.assertIs(kwargs["stdout"], subprocess.DEVNULL)
+        self.assertIs(kwargs["stderr"], subprocess.PIPE)
+
+    def test_run_command_tolerant_already_exists(self):
+        """Test that existing resources count as success."""
+        self.mock_run.return_value = MagicMock(returncode=1, stderr="ALREADY_EXISTS: index")
+        self.assertTrue(self.client.run_command_tolerant(["firestore", "indexes"]))
+
+    def test_run_command_tolerant_failure(self):
+        """Test that other errors are reported as failure."""
+        self.mock_run.return_value = MagicMock(returncode=1, stderr="INVALID_ARGUMENT")
+        self.assertFalse(self.client.run_command_tolerant(["firestore", "indexes"]))
+
+    def test_run_command_tolerant_prints_command_first(self):
+        """Test that the command is printed before it runs, the result after."""
+        def run(*args, **kwargs):
+            self.mock_print.assert_called_once_with(
+                "[~] gcloud firestore indexes --project=test-project --quiet", file=None
+            )
+            return MagicMock(returncode=1, stderr="INVALID_ARGUMENT")
+
+        self.mock_run.side_effect = run
+
+        self.client.run_command_tolerant(["firestore", "indexes"])
+
+        self.mock_print.assert_called_with("[!] Failed: invalid_argument", file=None)
+        self.assertEqual(self.mock_print.call_count, 2)
+
+    def test_run_command_tolerant_deferred_single_write(self):
+        """Test that deferred output prints the command and its result together."""
+        self.mock_run.return_value = MagicMock(returncode=1, stderr="INVALID_ARGUMENT")
+
+        self.client.run_command_tolerant(["firestore", "indexes"], defer_output=True)
+
+        self.mock_print.assert_called_once_with(
+            "[~] gcloud firestore indexes --project=test-project --quiet\n"
+            "[!] Failed: invalid_argument",
+            file=None
+        )
+
+    def test_run_command_json(self):
+        """Test that JSON output is captured and parsed."""
+        self.mock_run.return_value = MagicMock(returncode=0, stdout=b'[{"name": "a"}]', stderr=b"")
+
+        result = self.client.run_command(["firestore", "indexes"], capture_json=True)
+
+        self.assertEqual(result, [{"name": "a"}])
+        self.assertIs(self.mock_run.call_args[1]["stdout"], subprocess.PIPE)
+        self.assertNotIn("text", self.mock_run.call_args[1])
+
+    def test_run_command_invalid_json_exits(self):
+        """Test that unparseable JSON output exits."""
+        self.mock_run.return_value = MagicMock(returncode=0, stdout=b"not json", stderr=b"")
+
+        with self.assertRaises(SystemExit):
+            self.client.run_command(["firestore", "indexes"], capture_json=True)
+
+    def test_run_command_without_json_discards_stdout(self):
+        """Test that stdout is not piped when output is not parsed."""
+        self.mock_run.return_value = MagicMock(returncode=0, stderr=b"")
+
+        self.assertIsNone(self.client.run_command(["firestore", "indexes"]))
+        self.assertIs(self.mock_run.call_args[1]["stdout"], subprocess.DEVNULL)
+
+    def test_export_to_file_binary(self):
+        """Test that export streams gcloud output into a binary file."""
+        self.mock_run.return_value = MagicMock(returncode=0, stderr=b"")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "out.json"
+            self.client.export_to_file(["firestore", "indexes"], output_path)
+
+            stdout = self.mock_run.call_args[1]["stdout"]
+            self.assertEqual(stdout.name, str(output_path))
+            self.assertIn("b", stdout.mode)
+            self.assertNotIn("text", self.mock_run.call_args[1])
+
+    def test_export_to_file_failure_exits(self):
+        """Test that failed export exits."""
+        self.mock_run.return_value = MagicMock(returncode=1, stderr=b"denied")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(SystemExit):
+                self.client.export_to_file(["firestore", "indexes"], Path(tmpdir) / "out.json")
+
+    def test_run_command_failure_exits(self):
+        """Test that failed command exits."""
+        self.mock_run.return_value = MagicMock(returncode=1, stderr=b"error")
+
+        with self.assertRaises(SystemExit):
+            self.client.run_command(["firestore", "indexes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
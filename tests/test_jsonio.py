@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for firesync.jsonio module."""
+
+import json
+import unittest
+from unittest.mock import patch
+
+from firesync import jsonio
+
+
+class TestLoads(unittest.TestCase):
+    """Tests for loads function."""
+
+    def test_loads_bytes(self):
+        """Test parsing UTF-8 encoded bytes."""
+        self.assertEqual(jsonio.loads(b'{"project_id": "test"}'), {"project_id": "test"})
+
+    def test_loads_str(self):
+        """Test parsing str content."""
+        self.assertEqual(jsonio.loads('{"project_id": "test"}'), {"project_id": "test"})
+
+    def test_loads_invalid(self):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        with self.assertRaises(json.JSONDecodeError):
+            jsonio.loads(b'{not json')
+
+    def test_loads_stdlib_fallback(self):
+        """Test parsing without orjson installed."""
+        with patch('firesync.jsonio.orjson', None):
+            self.assertEqual(jsonio.loads(b'{"a": [1, 2]}'), {"a": [1, 2]})
+            with self.assertRaises(json.JSONDecodeError):
+                jsonio.loads(b'{not json')
+
+
+class TestDumpsPretty(unittest.TestCase):
+    """Tests for dumps_pretty function."""
+
+    def setUp(self):
+        """Set up sample schema data."""
+        self.data = [
+            {"collectionGroup": "пользователи", "fields": [{"fieldPath": "a", "order": "ASCENDING"}]},
+            {"empty": [], "nested": {}, "flag": True, "count": 3, "none": None}
+        ]
+        self.expected = json.dumps(self.data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def test_matches_stdlib_format(self):
+        """Test that output matches stdlib json with indent=2."""
+        self.assertEqual(jsonio.dumps_pretty(self.data), self.expected)
+
+    def test_stdlib_fallback(self):
+        """Test serializing without orjson installed."""
+        with patch('firesync.jsonio.orjson', None):
+            self.assertEqual(jsonio.dumps_pretty(self.data), self.expected)
+
+    def test_not_serializable(self):
+        """Test that unsupported objects raise TypeError."""
+        with self.assertRaises(TypeError):
+            jsonio.dumps_pretty([object()])
+
+
+if __name__ == '__main__':
+    unittest.main()
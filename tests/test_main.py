@@ -0,0 +1,116 @@
+"""Unit tests for firesync.main module."""
+
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from firesync import __version__
+from firesync.main import _get_parser, create_parser, forward_args, main
+
+
+class TestForwardArgs(unittest.TestCase):
+    """Tests for forward_args function."""
+
+    def setUp(self):
+        """Set up top-level parser."""
+        self.parser = create_parser()
+
+    def test_forward_pull(self):
+        """Test forwarding pull arguments."""
+        cases = [
+            (['pull', '--all'], ['--all']),
+            (['pull', '--env', 'dev'], ['--env', 'dev']),
+            (['pull', '--all', '--parallel', '2'], ['--all', '--parallel', '2']),
+        ]
+        for argv, expected in cases:
+            with self.subTest(argv=argv):
+                args = self.parser.parse_args(argv)
+                self.assertEqual(forward_args(args, 'pull'), expected)
+
+    def test_forward_plan(self):
+        """Test forwarding plan arguments in both modes."""
+        cases = [
+            (['plan', '--env', 'dev'], ['--env', 'dev']),
+            (
+                ['plan', '--env-from', 'dev', '--env-to', 'prod', '--schema-dir', 'custom'],
+                ['--env-from', 'dev', '--env-to', 'prod', '--schema-dir', 'custom']
+            ),
+            (['plan', '--env', 'dev', '--quiet'], ['--env', 'dev', '--quiet']),
+        ]
+        for argv, expected in cases:
+            with self.subTest(argv=argv):
+                args = self.parser.parse_args(argv)
+                self.assertEqual(forward_args(args, 'plan'), expected)
+
+    def test_forward_apply_options(self):
+        """Test forwarding apply concurrency options."""
+        args = self.parser.parse_args(['apply', '--env', 'dev', '--max-parallel', '0', '--async'])
+        self.assertEqual(
+            forward_args(args, 'apply'),
+            ['--env', 'dev', '--max-parallel', '0', '--async']
+        )
+
+    def test_forward_invalid_combination_for_validation(self):
+        """Test that conflicting options are forwarded so the command reports them."""
+        args = self.parser.parse_args(['apply', '--env-from', 'dev', '--env', 'prod'])
+        self.assertEqual(forward_args(args, 'apply'), ['--env-from', 'dev', '--env', 'prod'])
+
+
+class TestGetParser(unittest.TestCase):
+    """Tests for _get_parser function."""
+
+    def test_parser_reused(self):
+        """Test that the top-level parser is built only once."""
+        self.assertIs(_get_parser(), _get_parser())
+
+
+class TestMainDispatch(unittest.TestCase):
+    """Tests for subcommand dispatch in main function."""
+
+    def test_dispatch_passes_argv(self):
+        """Test that options are passed to the command without touching sys.argv."""
+        argv = ['firesync', 'plan', '--env', 'dev', '--quiet']
+        with patch.object(sys, 'argv', list(argv)):
+            with patch('firesync.commands.plan.main') as mock_main:
+                main()
+            self.assertEqual(sys.argv, argv)
+
+        mock_main.assert_called_once_with(['--env', 'dev', '--quiet'])
+
+    def test_version_skips_parser(self):
+        """Test that a bare --version is answered without building the parser."""
+        with patch.object(sys, 'argv', ['firesync', '--version']):
+            with patch('firesync.main._get_parser') as mock_get_parser:
+                with patch('builtins.print') as mock_print:
+                    main()
+
+        mock_get_parser.assert_not_called()
+        mock_print.assert_called_once_with(f'firesync {__version__}')
+
+    def test_version_does_not_import_argparse(self):
+        """Test that a bare --version runs without importing argparse."""
+        code = (
+            "import sys; sys.argv = ['firesync', '--version']; "
+            "from firesync.main import main; main(); "
+            "print('argparse' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(result.stdout.split(), ['firesync', __version__, 'False'])
+
+    def test_dispatch_env_passes_remaining_args(self):
+        """Test that env arguments are passed through unparsed."""
+        with patch.object(sys, 'argv', ['firesync', 'env', 'show', 'dev']):
+            with patch('firesync.commands.env.main') as mock_main:
+                main()
+
+        mock_main.assert_called_once_with(['show', 'dev'])
+
+
+if __name__ == '__main__':
+    unittest.main()
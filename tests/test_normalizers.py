@@ -40,6 +40,11 @@ class TestNormalizeCollectionName(unittest.TestCase):
         }
         self.assertEqual(normalize_collection_name(item), "users")
 
+    def test_from_resource_name_without_suffix(self):
+        """Test extraction when collection group is the last path segment."""
+        item = {"name": "projects/test/databases/(default)/collectionGroups/products"}
+        self.assertEqual(normalize_collection_name(item), "products")
+
     def test_missing_collection(self):
         """Test handling of missing collection."""
         item = {"name": "projects/test/databases/(default)"}
@@ -76,6 +81,11 @@ class TestNormalizeFieldPath(unittest.TestCase):
         }
         self.assertEqual(normalize_field_path(item), "name")
 
+    def test_from_resource_name_last_segment(self):
+        """Test that the text after the last /fields/ is used."""
+        item = {"name": "projects/test/databases/(default)/collectionGroups/fields/fields/status"}
+        self.assertEqual(normalize_field_path(item), "status")
+
     def test_missing_field(self):
         """Test handling of missing field."""
         item = {"name": "projects/test"}
@@ -127,6 +137,19 @@ class TestNormalizeFields(unittest.TestCase):
         """Test handling of empty list."""
         self.assertEqual(normalize_fields([]), [])
 
+    def test_matches_normalize_field_config(self):
+        """Test that each entry matches normalize_field_config."""
+        fields = [
+            {"fieldPath": "tags", "arrayConfig": "CONTAINS"},
+            {"fieldPath": "name"},
+            {"order": "DESCENDING"},
+            {"fieldPath": "age", "order": "ASCENDING"}
+        ]
+        self.assertEqual(
+            normalize_fields(fields),
+            sorted(normalize_field_config(f) for f in fields)
+        )
+
 
 class TestNormalizeIndexValue(unittest.TestCase):
     """Tests for normalize_index_value function."""
@@ -69,6 +69,29 @@ class TestCompositeIndexOperations(unittest.TestCase):
         self.assertEqual(len(diff["create"]), 0)
         self.assertEqual(len(diff["delete"]), 0)
 
+    def test_compare_mixed(self):
+        """Test comparison splits differing indexes into create and delete."""
+        shared = {
+            "collectionGroup": "users",
+            "queryScope": "COLLECTION",
+            "fields": [{"fieldPath": "name", "order": "ASCENDING"}]
+        }
+        local_only = {
+            "collectionGroup": "orders",
+            "queryScope": "COLLECTION",
+            "fields": [{"fieldPath": "total", "order": "ASCENDING"}]
+        }
+        remote_only = {
+            "collectionGroup": "products",
+            "queryScope": "COLLECTION",
+            "fields": [{"fieldPath": "price", "order": "DESCENDING"}]
+        }
+
+        diff = CompositeIndexOperations.compare([shared, local_only], [shared, remote_only])
+
+        self.assertEqual(diff["create"], {CompositeIndexOperations.normalize(local_only)})
+        self.assertEqual(diff["delete"], {CompositeIndexOperations.normalize(remote_only)})
+
     def test_compare_skips_invalid(self):
         """Test comparison skips invalid indexes."""
         local = [
@@ -175,6 +198,50 @@ class TestFieldIndexOperations(unittest.TestCase):
         self.assertEqual(diff["create"][0], ("orders", "total", "descending"))
         self.assertEqual(len(diff["delete"]), 0)
 
+    def test_compare_same_values_different_order(self):
+        """Test that value order and duplicates do not produce changes."""
+        local = [{
+            "collectionGroupId": "orders",
+            "fieldPath": "total",
+            "indexes": [{"order": "DESCENDING"}, {"order": "ASCENDING"}, {"order": "ASCENDING"}]
+        }]
+        remote = [{
+            "name": "projects/x/collectionGroups/orders/fields/total",
+            "indexes": [{"order": "ASCENDING"}, {"order": "DESCENDING"}]
+        }]
+
+        diff = FieldIndexOperations.compare(local, remote)
+
+        self.assertEqual(diff, {"create": [], "delete": []})
+
+    def test_compare_mixed(self):
+        """Test creates and deletes across shared and one-sided fields."""
+        local = [
+            {"collectionGroupId": "orders", "fieldPath": "total", "indexes": [{"order": "DESCENDING"}]},
+            {"collectionGroupId": "users", "fieldPath": "email", "indexes": [{"order": "ASCENDING"}]}
+        ]
+        remote = [
+            {
+                "name": "projects/x/collectionGroups/orders/fields/total",
+                "indexes": [{"order": "ASCENDING"}]
+            },
+            {
+                "name": "projects/x/collectionGroups/posts/fields/title",
+                "indexes": [{"arrayConfig": "CONTAINS"}]
+            }
+        ]
+
+        diff = FieldIndexOperations.compare(local, remote)
+
+        self.assertEqual(sorted(diff["create"]), [
+            ("orders", "total", "descending"),
+            ("users", "email", "ascending")
+        ])
+        self.assertEqual(sorted(diff["delete"]), [
+            ("orders", "total", "ascending"),
+            ("posts", "title", "contains")
+        ])
+
     def test_compare_skips_invalid(self):
         """Test comparison skips invalid indexes."""
         local = [
@@ -256,6 +323,23 @@ class TestTTLPolicyOperations(unittest.TestCase):
         self.assertEqual(len(diff["update"]), 1)
         self.assertEqual(diff["update"][0], ("logs", "timestamp", "86400s", "604800s"))
 
+    def test_compare_no_changes(self):
+        """Test comparison of identical TTL policies."""
+        local = [{
+            "collectionGroup": "logs",
+            "field": "timestamp",
+            "ttlConfig": {"ttlPeriod": "86400s", "state": "ACTIVE"}
+        }]
+        remote = [{
+            "collectionGroup": "logs",
+            "field": "timestamp",
+            "ttlPeriod": "86400s"
+        }]
+
+        diff = TTLPolicyOperations.compare(local, remote)
+
+        self.assertEqual(diff, {"create": [], "delete": [], "update": []})
+
     def test_compare_skips_invalid(self):
         """Test comparison skips invalid policies."""
         local = [
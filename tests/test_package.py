@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Tests for firesync package attributes."""
+
+import subprocess
+import sys
+import unittest
+
+import firesync
+
+
+class TestLazyAttributes(unittest.TestCase):
+    """Tests for lazily loaded package attributes."""
+
+    def test_public_classes(self):
+        """Test that public classes resolve to their defining modules."""
+        from firesync.config import FiresyncConfig
+        from firesync.gcloud import GCloudClient
+
+        self.assertIs(firesync.FiresyncConfig, FiresyncConfig)
+        self.assertIs(firesync.GCloudClient, GCloudClient)
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes raise AttributeError."""
+        with self.assertRaises(AttributeError):
+            firesync.NotAnAttribute
+
+    def test_dir_lists_public_names(self):
+        """Test that dir() includes lazily loaded names."""
+        self.assertTrue(set(firesync.__all__) <= set(dir(firesync)))
+
+    def test_import_does_not_load_submodules(self):
+        """Test that importing the package does not import config or gcloud."""
+        code = (
+            "import sys, firesync; "
+            "print('firesync.config' in sys.modules or 'firesync.gcloud' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+class TestLazyCommands(unittest.TestCase):
+    """Tests for lazily loaded command entry points."""
+
+    def test_command_entry_points(self):
+        """Test that entry points resolve to each command's main function."""
+        import firesync.commands
+        from firesync.commands import apply, env, init, plan, pull
+
+        for module in (apply, env, init, plan, pull):
+            with self.subTest(module=module.__name__):
+                name = module.__name__.rsplit(".", 1)[1] + "_main"
+                self.assertIs(getattr(firesync.commands, name), module.main)
+
+    def test_import_loads_single_command(self):
+        """Test that importing one command does not import the others."""
+        code = (
+            "import sys, firesync.commands.env; "
+            "print(sorted(m for m in sys.modules if m.startswith('firesync.commands.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        self.assertEqual(result.stdout.strip(), "['firesync.commands.env']")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 """Tests for firesync.workspace module."""
 
+import os
 import unittest
 import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import patch
 
+import yaml
+
+from firesync import workspace
 from firesync.workspace import (
     EnvironmentConfig,
     WorkspaceConfig,
@@ -20,61 +23,88 @@ from firesync.workspace import (
     CONFIG_FILE_NAME,
 )
 
+# Workspace configs written directly by tests that only need a starting state
+EMPTY_WORKSPACE_YAML = b"""\
+version: 1
+environments: {}
+settings:
+  schema_dir: schemas
+"""
 
-class TestEnvironmentConfig(unittest.TestCase):
-    """Tests for EnvironmentConfig dataclass."""
+THREE_ENVIRONMENTS_YAML = b"""\
+version: 1
+environments:
+  prod:
+    key_path: keys/prod.json
+  staging:
+    key_env: STAGING_KEY
+  dev:
+    key_env: DEV_KEY
+settings:
+  schema_dir: schemas
+"""
 
-    def test_valid_with_key_path(self):
-        """Test creating environment config with key_path."""
-        env = EnvironmentConfig(
-            name="production",
-            key_path="keys/prod.json",
-            description="Production environment"
-        )
-        self.assertEqual(env.name, "production")
-        self.assertEqual(env.key_path, "keys/prod.json")
-        self.assertIsNone(env.key_env)
-        self.assertEqual(env.description, "Production environment")
-
-    def test_valid_with_key_env(self):
-        """Test creating environment config with key_env."""
-        env = EnvironmentConfig(
-            name="staging",
-            key_env="GCP_STAGING_KEY"
-        )
-        self.assertEqual(env.name, "staging")
-        self.assertIsNone(env.key_path)
-        self.assertEqual(env.key_env, "GCP_STAGING_KEY")
 
-    def test_both_key_path_and_key_env_raises_error(self):
-        """Test that specifying both key_path and key_env raises ValueError."""
-        with self.assertRaises(ValueError) as ctx:
-            EnvironmentConfig(
-                name="invalid",
-                key_path="keys/prod.json",
-                key_env="GCP_KEY"
-            )
-        self.assertIn("cannot specify both", str(ctx.exception))
-        self.assertIn("invalid", str(ctx.exception))
+class TempDirTestCase(unittest.TestCase):
+    """Base class giving each test its own directory under a per-class temporary root."""
 
-    def test_neither_key_path_nor_key_env_raises_error(self):
-        """Test that omitting both key_path and key_env raises ValueError."""
-        with self.assertRaises(ValueError) as ctx:
-            EnvironmentConfig(name="invalid")
-        self.assertIn("must specify either", str(ctx.exception))
-        self.assertIn("invalid", str(ctx.exception))
+    @classmethod
+    def setUpClass(cls):
+        """Create temporary root shared by all tests."""
+        cls.temp_root = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove temporary root."""
+        cls.temp_root.cleanup()
+
+    def setUp(self):
+        """Create temporary directory for testing."""
+        self.temp_dir = Path(tempfile.mkdtemp(dir=self.temp_root.name))
+
+
+class TestEnvironmentConfig(unittest.TestCase):
+    """Tests for EnvironmentConfig dataclass."""
+
+    def test_valid_configs(self):
+        """Test creating environment config with exactly one key option."""
+        cases = [
+            {'name': "production", 'key_path': "keys/prod.json", 'description': "Production environment"},
+            {'name': "staging", 'key_env': "GCP_STAGING_KEY"},
+        ]
+        for kwargs in cases:
+            with self.subTest(**kwargs):
+                env = EnvironmentConfig(**kwargs)
+                self.assertEqual(env.name, kwargs['name'])
+                self.assertEqual(env.key_path, kwargs.get('key_path'))
+                self.assertEqual(env.key_env, kwargs.get('key_env'))
+                self.assertEqual(env.description, kwargs.get('description'))
+
+    def test_invalid_key_options_raise_error(self):
+        """Test that both or neither of key_path and key_env raises ValueError."""
+        cases = [
+            ({'key_path': "keys/prod.json", 'key_env': "GCP_KEY"}, "cannot specify both"),
+            ({}, "must specify either"),
+        ]
+        for kwargs, message in cases:
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError) as ctx:
+                    EnvironmentConfig(name="invalid", **kwargs)
+                self.assertIn(message, str(ctx.exception))
+                self.assertIn("invalid", str(ctx.exception))
 
 
 class TestWorkspaceConfig(unittest.TestCase):
     """Tests for WorkspaceConfig dataclass."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.env1 = EnvironmentConfig(name="prod", key_path="keys/prod.json")
-        self.env2 = EnvironmentConfig(name="staging", key_env="GCP_STAGING_KEY")
-        self.config = WorkspaceConfig(
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only config shared by all tests."""
+        cls.env1 = EnvironmentConfig(name="prod", key_path="keys/prod.json")
+        cls.env2 = EnvironmentConfig(name="staging", key_env="GCP_STAGING_KEY")
+        cls.config = WorkspaceConfig(
             version=1,
-            environments={"prod": self.env1, "staging": self.env2},
+            environments={"prod": cls.env1, "staging": cls.env2},
             schema_dir="schemas",
             config_path=Path("/project/firestore-migration/config.yaml")
         )
@@ -86,6 +116,10 @@ class TestWorkspaceConfig(unittest.TestCase):
             Path("/project/firestore-migration")
         )
 
+    def test_config_dir_cached(self):
+        """Test that config_dir is computed once per config."""
+        self.assertIs(self.config.config_dir, self.config.config_dir)
+
     def test_get_env_success(self):
         """Test getting existing environment."""
         env = self.config.get_env("prod")
@@ -107,37 +141,32 @@ class TestWorkspaceConfig(unittest.TestCase):
         )
 
 
-class TestFindConfig(unittest.TestCase):
+class TestFindConfig(TempDirTestCase):
     """Tests for find_config function."""
 
-    def setUp(self):
-        """Create temporary directory structure for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.addCleanup(lambda: shutil.rmtree(self.temp_dir))
-
     def test_find_config_in_current_dir(self):
         """Test finding config in current directory."""
         # Create config in temp_dir
-        config_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
+        config_dir = self.temp_dir / CONFIG_DIR_NAME
         config_dir.mkdir()
         config_path = config_dir / CONFIG_FILE_NAME
         config_path.touch()
 
         # Search from temp_dir
-        found = find_config(Path(self.temp_dir))
+        found = find_config(self.temp_dir)
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         self.assertEqual(found.resolve(), config_path.resolve())
 
     def test_find_config_in_parent_dir(self):
         """Test finding config in parent directory."""
         # Create config in temp_dir
-        config_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
+        config_dir = self.temp_dir / CONFIG_DIR_NAME
         config_dir.mkdir()
         config_path = config_dir / CONFIG_FILE_NAME
         config_path.touch()
 
         # Create subdirectory
-        subdir = Path(self.temp_dir) / "project" / "src"
+        subdir = self.temp_dir / "project" / "src"
         subdir.mkdir(parents=True)
 
         # Search from subdirectory
@@ -148,7 +177,7 @@ class TestFindConfig(unittest.TestCase):
     def test_find_config_not_found(self):
         """Test that None is returned when config is not found."""
         # Search from temp_dir (no config created)
-        found = find_config(Path(self.temp_dir))
+        found = find_config(self.temp_dir)
         self.assertIsNone(found)
 
     def test_find_config_stops_at_root(self):
@@ -161,10 +190,10 @@ class TestFindConfig(unittest.TestCase):
     @patch('firesync.workspace.Path.cwd')
     def test_find_config_uses_cwd_by_default(self, mock_cwd):
         """Test that find_config uses current directory by default."""
-        mock_cwd.return_value = Path(self.temp_dir)
+        mock_cwd.return_value = self.temp_dir
 
         # Create config in temp_dir
-        config_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
+        config_dir = self.temp_dir / CONFIG_DIR_NAME
         config_dir.mkdir()
         config_path = config_dir / CONFIG_FILE_NAME
         config_path.touch()
@@ -174,27 +203,25 @@ class TestFindConfig(unittest.TestCase):
         self.assertEqual(found, config_path)
 
 
-class TestLoadConfig(unittest.TestCase):
+class TestLoadConfig(TempDirTestCase):
     """Tests for load_config function."""
 
     def setUp(self):
-        """Create temporary directory for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.addCleanup(lambda: shutil.rmtree(self.temp_dir))
+        """Create workspace directory for testing."""
+        super().setUp()
 
         # Create workspace directory
-        self.config_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
+        self.config_dir = self.temp_dir / CONFIG_DIR_NAME
         self.config_dir.mkdir()
         self.config_path = self.config_dir / CONFIG_FILE_NAME
 
-    def write_config(self, content: str):
+    def write_config(self, content: bytes):
         """Helper to write config file."""
-        with open(self.config_path, 'w') as f:
-            f.write(content)
+        self.config_path.write_bytes(content)
 
     def test_load_valid_config(self):
         """Test loading valid configuration."""
-        self.write_config("""
+        self.write_config(b"""
 version: 1
 environments:
   production:
@@ -227,7 +254,7 @@ settings:
 
     def test_load_config_minimal(self):
         """Test loading minimal valid configuration."""
-        self.write_config("""
+        self.write_config(b"""
 version: 1
 environments:
   dev:
@@ -243,7 +270,7 @@ settings:
 
     def test_load_config_default_schema_dir(self):
         """Test that schema_dir defaults to 'schemas' if not specified."""
-        self.write_config("""
+        self.write_config(b"""
 version: 1
 environments:
   dev:
@@ -255,51 +282,84 @@ settings: {}
 
     def test_load_config_missing_file(self):
         """Test that FileNotFoundError is raised when config doesn't exist."""
-        non_existent = Path(self.temp_dir) / "nonexistent.yaml"
+        non_existent = self.temp_dir / "nonexistent.yaml"
         with self.assertRaises(FileNotFoundError):
             load_config(non_existent)
 
-    def test_load_config_invalid_yaml(self):
-        """Test that ValueError is raised for invalid YAML."""
-        self.write_config("invalid: yaml: content: [")
-        with self.assertRaises(ValueError) as ctx:
-            load_config(self.config_path)
-        self.assertIn("Invalid YAML", str(ctx.exception))
+    def test_load_config_validation_errors(self):
+        """Test that ValueError describes each kind of invalid config."""
+        cases = [
+            (b"invalid: yaml: content: [", "Invalid YAML"),
+            (b"- list\n- of\n- items", "must be a YAML dictionary"),
+            (b"version: 2\nenvironments: {}\n", "Unsupported config version: 2"),
+            (b"environments: {}\n", "Unsupported config version: None"),
+            (b"version: 1\nenvironments: [dev]\n", "'environments' must be a dictionary"),
+            (b"version: 1\nenvironments:\n  dev: dev.json\n", "Environment 'dev' must be a dictionary"),
+            (
+                b"version: 1\nenvironments:\n  dev:\n    key_path: dev.json\n    key_env: DEV_KEY\n",
+                "cannot specify both key_path and key_env"
+            ),
+            (b"version: 1\nenvironments:\n  dev: {}\n", "must specify either key_path or key_env"),
+            (b"version: 1\nsettings: [schemas]\n", "'settings' must be a dictionary"),
+            (b"version: 1\nsettings:\n  schema_dir: 1\n", "'settings.schema_dir' must be a string"),
+        ]
+        for index, (content, message) in enumerate(cases):
+            with self.subTest(message=message):
+                # Separate file per case, see the FileCache signature limitation
+                config_path = self.config_dir / f"invalid-{index}.yaml"
+                config_path.write_bytes(content)
+
+                with self.assertRaises(ValueError) as ctx:
+                    load_config(config_path)
+                self.assertIn(message, str(ctx.exception))
+
+    def test_load_config_returns_copy(self):
+        """Test that mutating a loaded config does not affect later loads."""
+        self.write_config(b"""
+version: 1
+environments:
+  dev:
+    key_path: dev.json
+""")
+        config = load_config(self.config_path)
+        del config.environments["dev"]
 
-    def test_load_config_not_dict(self):
-        """Test that ValueError is raised if config is not a dictionary."""
-        self.write_config("- list\n- of\n- items")
-        with self.assertRaises(ValueError) as ctx:
-            load_config(self.config_path)
-        self.assertIn("must be a YAML dictionary", str(ctx.exception))
+        reloaded = load_config(self.config_path)
+        self.assertIn("dev", reloaded.environments)
 
-    def test_load_config_wrong_version(self):
-        """Test that ValueError is raised for unsupported version."""
-        self.write_config("""
-version: 2
-environments: {}
-settings:
-  schema_dir: schemas
+    def test_load_config_picks_up_changes(self):
+        """Test that rewritten config is parsed again."""
+        self.write_config(b"""
+version: 1
+environments:
+  dev:
+    key_path: dev.json
 """)
-        with self.assertRaises(ValueError) as ctx:
-            load_config(self.config_path)
-        self.assertIn("Unsupported config version: 2", str(ctx.exception))
+        self.assertEqual(list(load_config(self.config_path).environments), ["dev"])
 
+        self.write_config(b"""
+version: 1
+environments:
+  dev:
+    key_path: dev.json
+  staging:
+    key_env: GCP_STAGING_KEY
+""")
+        self.assertEqual(
+            list(load_config(self.config_path).environments),
+            ["dev", "staging"]
+        )
 
-class TestInitWorkspace(unittest.TestCase):
-    """Tests for init_workspace function."""
 
-    def setUp(self):
-        """Create temporary directory for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.addCleanup(lambda: shutil.rmtree(self.temp_dir))
+class TestInitWorkspace(TempDirTestCase):
+    """Tests for init_workspace function."""
 
     def test_init_workspace_success(self):
         """Test successful workspace initialization."""
-        config_path = init_workspace(Path(self.temp_dir))
+        config_path = init_workspace(self.temp_dir)
 
         # Check that directories were created
-        workspace_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
+        workspace_dir = self.temp_dir / CONFIG_DIR_NAME
         self.assertTrue(workspace_dir.exists())
         self.assertTrue(workspace_dir.is_dir())
 
@@ -328,36 +388,35 @@ class TestInitWorkspace(unittest.TestCase):
     def test_init_workspace_already_exists(self):
         """Test that FileExistsError is raised if workspace already exists."""
         # Create workspace
-        workspace_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
+        workspace_dir = self.temp_dir / CONFIG_DIR_NAME
         workspace_dir.mkdir()
 
         # Try to init again
         with self.assertRaises(FileExistsError) as ctx:
-            init_workspace(Path(self.temp_dir))
+            init_workspace(self.temp_dir)
         self.assertIn("already exists", str(ctx.exception))
 
     @patch('firesync.workspace.Path.cwd')
     def test_init_workspace_uses_cwd_by_default(self, mock_cwd):
         """Test that init_workspace uses current directory by default."""
-        mock_cwd.return_value = Path(self.temp_dir)
+        mock_cwd.return_value = self.temp_dir
 
         config_path = init_workspace()
 
         # Check that workspace was created in temp_dir
-        expected_path = Path(self.temp_dir) / CONFIG_DIR_NAME / CONFIG_FILE_NAME
+        expected_path = self.temp_dir / CONFIG_DIR_NAME / CONFIG_FILE_NAME
         self.assertEqual(config_path, expected_path)
         self.assertTrue(config_path.exists())
 
     def test_init_workspace_config_is_loadable(self):
         """Test that generated config can be loaded successfully."""
-        config_path = init_workspace(Path(self.temp_dir))
+        config_path = init_workspace(self.temp_dir)
 
         # Try to load the config (should not raise)
         # Note: This will fail because environments is empty, but we can check
         # that the YAML is valid
-        import yaml
         with open(config_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=workspace._YAML_LOADER)
 
         self.assertIsInstance(data, dict)
         self.assertEqual(data['version'], 1)
@@ -365,16 +424,15 @@ class TestInitWorkspace(unittest.TestCase):
         self.assertIn('settings', data)
 
 
-class TestSaveConfig(unittest.TestCase):
+class TestSaveConfig(TempDirTestCase):
     """Tests for save_config function."""
 
     def setUp(self):
-        """Create temporary directory for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.addCleanup(lambda: shutil.rmtree(self.temp_dir))
+        """Create workspace directory for testing."""
+        super().setUp()
 
         # Create workspace directory
-        self.workspace_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
+        self.workspace_dir = self.temp_dir / CONFIG_DIR_NAME
         self.workspace_dir.mkdir()
         self.config_path = self.workspace_dir / CONFIG_FILE_NAME
 
@@ -403,31 +461,24 @@ class TestSaveConfig(unittest.TestCase):
         self.assertIn("dev", loaded_config.environments)
 
 
-class TestAddEnvironment(unittest.TestCase):
+class TestAddEnvironment(TempDirTestCase):
     """Tests for add_environment function."""
 
     def setUp(self):
         """Create temporary workspace for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.addCleanup(lambda: shutil.rmtree(self.temp_dir))
+        super().setUp()
 
         # Create workspace with initial config
-        self.workspace_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
+        self.workspace_dir = self.temp_dir / CONFIG_DIR_NAME
         self.workspace_dir.mkdir()
         self.config_path = self.workspace_dir / CONFIG_FILE_NAME
 
         # Create initial config
-        initial_config = WorkspaceConfig(
-            version=1,
-            environments={},
-            schema_dir="schemas",
-            config_path=self.config_path
-        )
-        save_config(initial_config)
+        self.config_path.write_bytes(EMPTY_WORKSPACE_YAML)
 
     def test_add_environment_with_key_env(self):
         """Test adding environment with key_env."""
-        add_environment(
+        added_env = add_environment(
             env_name="staging",
             key_env="GCP_STAGING_KEY",
             description="Staging environment",
@@ -439,9 +490,30 @@ class TestAddEnvironment(unittest.TestCase):
         self.assertIn("staging", config.environments)
 
         staging_env = config.environments["staging"]
+        self.assertEqual(staging_env, added_env)
         self.assertEqual(staging_env.key_env, "GCP_STAGING_KEY")
         self.assertIsNone(staging_env.key_path)
 
+    def test_add_environment_with_key_path_relative_to_cwd(self):
+        """Test that key_path given relative to cwd is stored relative to config.yaml."""
+        # (env name, cwd relative to temp root, key_path argument, stored key_path)
+        cases = [
+            ("root", ".", "keys/prod.json", os.path.join("..", "keys", "prod.json")),
+            ("nested", "project/src", "../../keys/prod.json", os.path.join("..", "keys", "prod.json")),
+            ("sibling", "other", "keys/prod.json", os.path.join("..", "other", "keys", "prod.json")),
+            ("workspace", CONFIG_DIR_NAME, "prod.json", "prod.json"),
+        ]
+        for env_name, cwd, key_path, expected in cases:
+            with self.subTest(cwd=cwd), patch('firesync.workspace.Path.cwd', return_value=self.temp_dir / cwd):
+                added_env = add_environment(
+                    env_name=env_name,
+                    key_path=key_path,
+                    config_path=self.config_path
+                )
+
+                self.assertEqual(added_env.key_path, expected)
+                self.assertEqual(load_config(self.config_path).environments[env_name].key_path, expected)
+
     def test_add_environment_already_exists(self):
         """Test that adding existing environment raises ValueError."""
         add_environment(
@@ -460,31 +532,20 @@ class TestAddEnvironment(unittest.TestCase):
         self.assertIn("already exists", str(ctx.exception))
 
 
-class TestRemoveEnvironment(unittest.TestCase):
+class TestRemoveEnvironment(TempDirTestCase):
     """Tests for remove_environment function."""
 
     def setUp(self):
         """Create temporary workspace with environments for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.addCleanup(lambda: shutil.rmtree(self.temp_dir))
+        super().setUp()
 
         # Create workspace with initial config
-        self.workspace_dir = Path(self.temp_dir) / CONFIG_DIR_NAME
+        self.workspace_dir = self.temp_dir / CONFIG_DIR_NAME
         self.workspace_dir.mkdir()
         self.config_path = self.workspace_dir / CONFIG_FILE_NAME
 
         # Create config with multiple environments
-        env1 = EnvironmentConfig(name="prod", key_path="keys/prod.json")
-        env2 = EnvironmentConfig(name="staging", key_env="STAGING_KEY")
-        env3 = EnvironmentConfig(name="dev", key_env="DEV_KEY")
-
-        initial_config = WorkspaceConfig(
-            version=1,
-            environments={"prod": env1, "staging": env2, "dev": env3},
-            schema_dir="schemas",
-            config_path=self.config_path
-        )
-        save_config(initial_config)
+        self.config_path.write_bytes(THREE_ENVIRONMENTS_YAML)
 
     def test_remove_environment_success(self):
         """Test removing an existing environment."""